@@ -0,0 +1,41 @@
+"""backfill events.group_id from raw_data
+
+Revision ID: a4c9e2b7d1f6
+Revises: f1b8d4a6c2e9
+Create Date: 2026-10-16 13:00:00.000000
+
+Event list and analytics group filters now compare the indexed
+``events.group_id`` column instead of extracting
+``raw_data.recipients.group.id`` per row. Sync and create have populated
+the column for a while, but older rows may still be NULL — copy the id
+out of raw_data for those.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'a4c9e2b7d1f6'
+down_revision: Union[str, None] = 'f1b8d4a6c2e9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    events = sa.table(
+        'events',
+        sa.column('group_id', sa.String),
+        sa.column('raw_data', sa.JSON),
+    )
+    op.execute(
+        events.update()
+        .where(events.c.group_id.is_(None))
+        .where(events.c.raw_data.isnot(None))
+        .values(group_id=events.c.raw_data[('recipients', 'group', 'id')].as_string())
+    )
+
+
+def downgrade() -> None:
+    # Data-only backfill; the populated ids are still correct, nothing to undo
+    pass
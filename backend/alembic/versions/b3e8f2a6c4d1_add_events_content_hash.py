@@ -0,0 +1,29 @@
+"""add events.content_hash
+
+Revision ID: b3e8f2a6c4d1
+Revises: a4c9e2b7d1f6
+Create Date: 2026-10-16 14:00:00.000000
+
+Digest of the Spond payload (raw_data + enriched responses) last written
+by the events sync. The sync upsert compares it to skip rewriting rows
+that did not change in Spond. NULL for existing rows, so the first sync
+after upgrading rewrites them once and fills it in.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'b3e8f2a6c4d1'
+down_revision: Union[str, None] = 'a4c9e2b7d1f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('events', sa.Column('content_hash', sa.String(length=32), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('events', 'content_hash')
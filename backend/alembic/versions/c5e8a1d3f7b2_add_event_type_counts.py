@@ -0,0 +1,45 @@
+"""add event_type_counts materialized aggregate
+
+Revision ID: c5e8a1d3f7b2
+Revises: b8e4f0a2d6c1
+Create Date: 2026-10-16 09:00:00.000000
+
+Adds ``event_type_counts`` — per (event_type, group) event counts that the
+analytics event-type distribution reads instead of a GROUP BY over the
+whole events table. Keyed by (event_type, group_id) so event writes can
+apply +/- deltas with INSERT ... ON CONFLICT; ungrouped events count under
+group_id ''. Backfilled here from the existing events.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'c5e8a1d3f7b2'
+down_revision: Union[str, None] = 'b8e4f0a2d6c1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'event_type_counts',
+        sa.Column('event_type', sa.String(length=50), nullable=False),
+        sa.Column('group_id', sa.String(length=255), server_default='', nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.Column('refreshed_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('event_type', 'group_id'),
+    )
+    op.execute(
+        """
+        INSERT INTO event_type_counts (event_type, group_id, count)
+        SELECT event_type, COALESCE(group_id, ''), COUNT(*)
+        FROM events
+        GROUP BY event_type, COALESCE(group_id, '')
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('event_type_counts')
@@ -0,0 +1,53 @@
+"""add groups.subgroup_count
+
+Revision ID: c6a2d9f4e8b3
+Revises: b3e8f2a6c4d1
+Create Date: 2026-10-16 15:00:00.000000
+
+Length of ``groups.subgroups``, written by the group sync alongside the
+JSON array. The has_subgroups filter and the group statistics read this
+indexed integer instead of evaluating json_array_length per row.
+
+A plain column rather than GENERATED ... STORED: SQLite cannot add a stored
+generated column to an existing table, and json_array_length raises on a
+JSON ``null`` in PostgreSQL.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'c6a2d9f4e8b3'
+down_revision: Union[str, None] = 'b3e8f2a6c4d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'groups',
+        sa.Column('subgroup_count', sa.Integer(), server_default='0', nullable=False),
+    )
+    op.create_index('ix_groups_subgroup_count', 'groups', ['subgroup_count'])
+
+    # Backfill from the stored arrays (groups is small)
+    groups = sa.table(
+        'groups',
+        sa.column('id', sa.Integer),
+        sa.column('subgroups', sa.JSON),
+        sa.column('subgroup_count', sa.Integer),
+    )
+    conn = op.get_bind()
+    for group_id, subgroups in conn.execute(sa.select(groups.c.id, groups.c.subgroups)):
+        if isinstance(subgroups, list) and subgroups:
+            conn.execute(
+                groups.update()
+                .where(groups.c.id == group_id)
+                .values(subgroup_count=len(subgroups))
+            )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_groups_subgroup_count', table_name='groups')
+    op.drop_column('groups', 'subgroup_count')
@@ -0,0 +1,51 @@
+"""add trigram indexes for event search
+
+Revision ID: d2f6b9e4a8c3
+Revises: c5e8a1d3f7b2
+Create Date: 2026-10-16 10:00:00.000000
+
+The events list search is ``heading ILIKE '%term%' OR description ILIKE
+'%term%'``. A leading wildcard can't use a B-tree, so every search was a
+sequential scan of ``events``. pg_trgm GIN indexes let the planner serve
+the same ILIKE predicates from an index — no query change needed.
+
+PostgreSQL only; other dialects (SQLite dev databases) are left as-is.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = 'd2f6b9e4a8c3'
+down_revision: Union[str, None] = 'c5e8a1d3f7b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'ix_events_heading_trgm',
+        'events',
+        ['heading'],
+        postgresql_using='gin',
+        postgresql_ops={'heading': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_events_description_trgm',
+        'events',
+        ['description'],
+        postgresql_using='gin',
+        postgresql_ops={'description': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.drop_index('ix_events_description_trgm', table_name='events')
+    op.drop_index('ix_events_heading_trgm', table_name='events')
@@ -0,0 +1,47 @@
+"""add trigram indexes for member search
+
+Revision ID: d8b4f1a7c3e5
+Revises: c6a2d9f4e8b3
+Create Date: 2026-10-16 16:00:00.000000
+
+The members list search is ``first_name/last_name/email ILIKE '%term%'``.
+Like the event search, the leading wildcard rules out a B-tree, so pg_trgm
+GIN indexes on the three columns let the planner serve the existing ILIKE
+predicates (OR'd via a BitmapOr) from an index — no query change needed.
+
+PostgreSQL only; other dialects (SQLite dev databases) are left as-is.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = 'd8b4f1a7c3e5'
+down_revision: Union[str, None] = 'c6a2d9f4e8b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COLUMNS = ('first_name', 'last_name', 'email')
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for column in _COLUMNS:
+        op.create_index(
+            f'ix_members_{column}_trgm',
+            'members',
+            [column],
+            postgresql_using='gin',
+            postgresql_ops={column: 'gin_trgm_ops'},
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for column in reversed(_COLUMNS):
+        op.drop_index(f'ix_members_{column}_trgm', table_name='members')
@@ -0,0 +1,32 @@
+"""add content_hash to members and groups
+
+Revision ID: e2c7a5b9d3f8
+Revises: d8b4f1a7c3e5
+Create Date: 2026-10-16 16:00:00.000000
+
+Digest of the Spond payload last written by a group/member sync. When the
+incoming payload hashes the same, the upsert only bumps last_synced_at
+and leaves the JSON columns untouched.
+
+Existing rows start with NULL and get a hash on their next sync.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'e2c7a5b9d3f8'
+down_revision: Union[str, None] = 'd8b4f1a7c3e5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('groups', sa.Column('content_hash', sa.String(length=32), nullable=True))
+    op.add_column('members', sa.Column('content_hash', sa.String(length=32), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('members', 'content_hash')
+    op.drop_column('groups', 'content_hash')
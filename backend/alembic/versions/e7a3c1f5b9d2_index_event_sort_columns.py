@@ -0,0 +1,29 @@
+"""index event sort columns
+
+Revision ID: e7a3c1f5b9d2
+Revises: d2f6b9e4a8c3
+Create Date: 2026-10-16 11:00:00.000000
+
+The events list can be ordered by start_time, created_time or heading.
+start_time was already indexed; index the other two so every allowed
+ORDER BY ... LIMIT can walk an index instead of sorting the table.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = 'e7a3c1f5b9d2'
+down_revision: Union[str, None] = 'd2f6b9e4a8c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_events_created_time', 'events', ['created_time'])
+    op.create_index('ix_events_heading', 'events', ['heading'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_events_heading', table_name='events')
+    op.drop_index('ix_events_created_time', table_name='events')
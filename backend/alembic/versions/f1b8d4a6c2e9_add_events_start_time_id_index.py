@@ -0,0 +1,27 @@
+"""add events (start_time, id) index for keyset pagination
+
+Revision ID: f1b8d4a6c2e9
+Revises: e7a3c1f5b9d2
+Create Date: 2026-10-16 12:00:00.000000
+
+The events list accepts a (start_time, id) cursor and filters with a
+row-value comparison ordered by start_time, id. A composite index lets
+that seek straight to the cursor instead of scanning past OFFSET rows.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = 'f1b8d4a6c2e9'
+down_revision: Union[str, None] = 'e7a3c1f5b9d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_events_start_time_id', 'events', ['start_time', 'id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_events_start_time_id', table_name='events')
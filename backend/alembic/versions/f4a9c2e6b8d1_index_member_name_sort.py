@@ -0,0 +1,31 @@
+"""index members (last_name, first_name)
+
+Revision ID: f4a9c2e6b8d1
+Revises: e2c7a5b9d3f8
+Create Date: 2026-10-16 17:00:00.000000
+
+The members list is ordered by last_name, first_name by default (and as
+the tie-breaker for the other sort keys). The separate single-column
+indexes can't serve that ORDER BY ... LIMIT; a composite index can.
+
+members.spond_id and groups.spond_id are already unique-indexed.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = 'f4a9c2e6b8d1'
+down_revision: Union[str, None] = 'e2c7a5b9d3f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_members_last_name_first_name', 'members', ['last_name', 'first_name']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_members_last_name_first_name', table_name='members')
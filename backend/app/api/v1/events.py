@@ -1,9 +1,10 @@
 """
 Events API endpoints
 """
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime, timezone
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.deps import get_current_user, get_current_admin, get_current_editor_or_above
@@ -17,11 +18,16 @@ from app.schemas.event import (
     EventFilters,
     EventStats,
     EventResponseUpdate,
+    EventBulkCreate,
+    EventBulkResponseUpdate,
+    EventBulkResponseResult,
+    EventBulkPushRequest,
     EventSyncResult,
 )
 from app.services.event_service import EventService
 from app.services.event_sync_service import EventSyncService
 from app.services.spond_service import get_spond_service, SpondService
+from app.services.scheduler_service import scheduler_service
 
 router = APIRouter()
 
@@ -48,19 +54,22 @@ async def sync_events(
         Sync result with statistics
     """
     try:
-        stats = await EventSyncService.sync_events(
-            db,
-            spond_service,
-            group_id=group_id,
-            max_events=max_events
-        )
+        # Held through the commit, so a scheduled run can't overlap this one
+        async with scheduler_service.sync_lock:
+            stats = await EventSyncService.sync_events(
+                db,
+                spond_service,
+                group_id=group_id,
+                max_events=max_events
+            )
 
-        await db.commit()
+            await db.commit()
 
         return EventSyncResult(
             total_fetched=stats["fetched"],
             created=stats["created"],
             updated=stats["updated"],
+            skipped=stats["skipped"],
             errors=stats["errors"],
             sync_time=datetime.now(timezone.utc),
         )
@@ -113,6 +122,40 @@ async def create_event(
         )
 
 
+@router.post("/bulk", response_model=List[EventResponse], status_code=status.HTTP_201_CREATED)
+async def create_events_bulk(
+    create_data: EventBulkCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: Admin = Depends(get_current_editor_or_above),
+):
+    """
+    Create several local-only events in one insert (import flows)
+
+    Args:
+        create_data: Events to create
+        db: Database session
+        current_user: Current authenticated user
+
+    Returns:
+        Created events
+
+    Raises:
+        HTTPException: If creation fails
+    """
+    try:
+        events = await EventService.create_many(db, create_data.events)
+
+        await db.commit()
+        return events
+
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to create events: {str(e)}"
+        )
+
+
 @router.get("", response_model=EventListResponse)
 async def list_events(
     skip: int = Query(0, ge=0),
@@ -127,6 +170,8 @@ async def list_events(
     search: Optional[str] = None,
     order_by: str = Query("start_time", regex="^(start_time|created_time|heading)$"),
     order_desc: bool = True,
+    after_start_time: Optional[datetime] = Query(None, description="Cursor: start_time of the last event on the previous page"),
+    after_id: Optional[int] = Query(None, description="Cursor: id of the last event on the previous page"),
     db: AsyncSession = Depends(get_db),
     current_user: Admin = Depends(get_current_user),
 ):
@@ -146,12 +191,37 @@ async def list_events(
         search: Search in heading and description
         order_by: Field to order by (start_time, created_time, heading)
         order_desc: Order descending if True
+        after_start_time: Keyset cursor start_time (use with after_id)
+        after_id: Keyset cursor id (use with after_start_time)
         db: Database session
         current_user: Current authenticated user
 
     Returns:
         Paginated list of events
+
+    Raises:
+        HTTPException: If the cursor is incomplete or used with another ordering
     """
+    # Keyset cursor: pass the last event's (start_time, id) to fetch the
+    # next page without OFFSET. Only defined for start_time ordering.
+    after = None
+    if after_start_time is not None or after_id is not None:
+        if after_start_time is None or after_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="after_start_time and after_id must be given together"
+            )
+        if order_by != "start_time":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cursor pagination requires order_by=start_time"
+            )
+        # Same tz-naive UTC normalization as EventFilters: start_time is
+        # TIMESTAMP WITHOUT TIME ZONE, and asyncpg rejects aware values
+        if after_start_time.tzinfo is not None:
+            after_start_time = after_start_time.astimezone(timezone.utc).replace(tzinfo=None)
+        after = (after_start_time, after_id)
+
     # Build filters
     filters = EventFilters(
         group_id=group_id,
@@ -172,6 +242,7 @@ async def list_events(
         limit=limit,
         order_by=order_by,
         order_desc=order_desc,
+        after=after,
     )
 
     return EventListResponse(
@@ -343,6 +414,38 @@ async def push_event_to_spond(
         )
 
 
+@router.post("/push-to-spond", response_model=List[EventResponse])
+async def push_events_to_spond(
+    push_data: EventBulkPushRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: Admin = Depends(get_current_admin),
+    spond_service: SpondService = Depends(get_spond_service),
+):
+    """
+    Push several local or pending events to Spond
+
+    The Spond calls run concurrently; each event's sync_status/sync_error
+    reports its own outcome.
+
+    Args:
+        push_data: IDs of the events to push
+        db: Database session
+        current_user: Current authenticated user
+        spond_service: Spond service instance
+
+    Returns:
+        The pushed events with their sync status
+    """
+    events = await EventService.push_many_to_spond(
+        db,
+        push_data.event_ids,
+        spond_service
+    )
+
+    await db.commit()
+    return events
+
+
 @router.delete("/{event_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_event(
     event_id: int,
@@ -394,18 +497,16 @@ async def get_event_attendance(
         HTTPException: If event not found or export fails
     """
     try:
-        xlsx_data = await EventService.get_attendance_export(
+        event, xlsx_stream = await EventService.get_attendance_export(
             db,
             event_id,
             spond_service
         )
 
-        # Get event for filename
-        event = await EventService.get_by_id(db, event_id)
         filename = f"attendance_{event.heading.replace(' ', '_')}_{event.start_time.strftime('%Y%m%d')}.xlsx"
 
-        return Response(
-            content=xlsx_data,
+        return StreamingResponse(
+            xlsx_stream,
             media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             headers={
                 "Content-Disposition": f'attachment; filename="{filename}"'
@@ -477,3 +578,50 @@ async def update_event_response(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to update response: {str(e)}"
         )
+
+
+@router.put("/{event_id}/responses/bulk", response_model=EventBulkResponseResult)
+async def update_event_responses_bulk(
+    event_id: int,
+    response_data: EventBulkResponseUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user: Admin = Depends(get_current_editor_or_above),
+    spond_service: SpondService = Depends(get_spond_service),
+):
+    """
+    Set the same response for several users on an event
+
+    One request for e.g. "mark everyone attending", instead of one
+    PUT /responses per user; the Spond calls run concurrently.
+
+    Args:
+        event_id: Event ID
+        response_data: User IDs and the response to set
+        db: Database session
+        current_user: Current authenticated user
+        spond_service: Spond service instance
+
+    Returns:
+        Count of updated responses and the user IDs that failed
+
+    Raises:
+        HTTPException: If event not found
+    """
+    failed = await EventService.update_responses(
+        db,
+        event_id,
+        response_data.user_ids,
+        response_data.response_type,
+        spond_service
+    )
+
+    if failed is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Event not found"
+        )
+
+    return EventBulkResponseResult(
+        updated=len(response_data.user_ids) - len(failed),
+        failed_user_ids=failed,
+    )
@@ -13,6 +13,7 @@ from app.models.admin import Admin
 from app.services.spond_service import get_spond_service, SpondService
 from app.services.group_service import GroupService
 from app.services.group_sync_service import GroupSyncService
+from app.services.scheduler_service import scheduler_service
 from app.schemas.group import (
     GroupResponse,
     GroupListResponse,
@@ -36,9 +37,11 @@ async def sync_groups(
     Synchronize groups from Spond API to local database
     """
     try:
-        stats = await GroupSyncService.sync_groups(db, spond)
+        # Held through the commit, so a scheduled run can't overlap this one
+        async with scheduler_service.sync_lock:
+            stats = await GroupSyncService.sync_groups(db, spond)
 
-        await db.commit()
+            await db.commit()
 
         return GroupSyncResult(
             total_fetched=stats["fetched"],
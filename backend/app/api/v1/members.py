@@ -14,6 +14,7 @@ from app.services.spond_service import get_spond_service, SpondService
 from app.services.member_service import MemberService
 from app.services.member_sync_service import MemberSyncService
 from app.services.archer_profile_service import ArcherProfileService
+from app.services.scheduler_service import scheduler_service
 from app.schemas.member import (
     MemberResponse,
     MemberListResponse,
@@ -46,9 +47,11 @@ async def sync_members(
     and extract their members.
     """
     try:
-        stats = await MemberSyncService.sync_members(db, spond, group_id)
+        # Held through the commit, so a scheduled run can't overlap this one
+        async with scheduler_service.sync_lock:
+            stats = await MemberSyncService.sync_members(db, spond, group_id)
 
-        await db.commit()
+            await db.commit()
 
         return MemberSyncResult(
             total_fetched=stats["fetched"],
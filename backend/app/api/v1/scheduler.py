@@ -61,7 +61,9 @@ async def trigger_job(
     Manually trigger a scheduled job to run immediately
 
     Args:
-        job_id: ID of the job to trigger (sync_events, sync_groups, sync_members)
+        job_id: ID of the job to trigger (sync_spond for the enabled syncs,
+            sync_events, sync_groups or sync_members when that sync is
+            enabled, or sync_all for all three)
 
     Returns:
         Success message with job ID
@@ -35,6 +35,25 @@ class Settings(BaseSettings):
         description="Async database URL"
     )
 
+    # Connection pool (ignored for SQLite). Sized per worker process, so
+    # GUNICORN_WORKERS * (pool + overflow) must stay under max_connections.
+    DB_POOL_SIZE: int = Field(
+        default=10,
+        description="Persistent connections kept open per worker"
+    )
+    DB_MAX_OVERFLOW: int = Field(
+        default=10,
+        description="Extra connections allowed beyond DB_POOL_SIZE under burst load"
+    )
+    DB_POOL_RECYCLE_SECONDS: int = Field(
+        default=1800,
+        description="Recycle connections older than this to dodge server-side idle timeouts"
+    )
+    DB_POOL_WARMUP: bool = Field(
+        default=True,
+        description="Open DB_POOL_SIZE connections at startup instead of on first requests"
+    )
+
     # Security
     # SECRET_KEY is still required: app/core/encryption.py derives a Fernet
     # key from it to encrypt AI provider API keys in the database.
@@ -0,0 +1,30 @@
+"""
+Dialect-aware SQL functions
+"""
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+from sqlalchemy.types import DateTime
+
+
+class utcnow(FunctionElement):
+    """
+    Current time as tz-naive UTC, evaluated by the database
+
+    The event timestamp columns are TIMESTAMP WITHOUT TIME ZONE holding UTC.
+    PostgreSQL's now() is timestamptz, and comparing it with those columns
+    converts through the server's TimeZone setting; this expression gives
+    a value that compares correctly whatever that setting is.
+    """
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw):
+    # SQLite's CURRENT_TIMESTAMP is already UTC
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "postgresql")
+def _utcnow_postgresql(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
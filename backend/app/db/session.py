@@ -1,6 +1,7 @@
 """
 Database session management
 """
+import asyncio
 from typing import AsyncGenerator
 from fastapi import HTTPException
 from sqlalchemy import event, text
@@ -16,6 +17,9 @@ from app.db.base import Base
 # Build engine kwargs based on database type
 _is_sqlite = settings.DATABASE_URL.startswith("sqlite")
 
+# pool_pre_ping applies to every engine: it catches connections the server
+# or a proxy dropped between checkouts, which pool_recycle (age-based, set
+# below for PostgreSQL) does not.
 _engine_kwargs = dict(
     echo=settings.DEBUG,
     future=True,
@@ -26,19 +30,24 @@ if _is_sqlite:
     _engine_kwargs["connect_args"] = {"check_same_thread": False}
 else:
     # PostgreSQL / other databases: configure connection pool
-    _engine_kwargs["pool_size"] = 5
-    _engine_kwargs["max_overflow"] = 10
+    _engine_kwargs["pool_size"] = settings.DB_POOL_SIZE
+    _engine_kwargs["max_overflow"] = settings.DB_MAX_OVERFLOW
+    _engine_kwargs["pool_recycle"] = settings.DB_POOL_RECYCLE_SECONDS
 
 # Create async engine
 engine = create_async_engine(settings.DATABASE_URL, **_engine_kwargs)
 
-# Enable WAL mode and busy timeout for SQLite on every connection
+# Enable WAL mode and busy timeout for SQLite on every connection. Pooled
+# connections keep their page cache, so give it room (64 MiB) to stay hot;
+# synchronous=NORMAL is durable across app crashes in WAL mode.
 if _is_sqlite:
     @event.listens_for(engine.sync_engine, "connect")
     def _set_sqlite_pragmas(dbapi_conn, connection_record):
         cursor = dbapi_conn.cursor()
         cursor.execute("PRAGMA journal_mode=WAL")
         cursor.execute("PRAGMA busy_timeout=5000")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA cache_size=-65536")
         cursor.close()
 
 # Create async session factory
@@ -71,6 +80,23 @@ async def init_db() -> None:
         await conn.run_sync(Base.metadata.create_all)
 
 
+async def warm_up_pool() -> None:
+    """
+    Pre-open the pooled connections so the first burst of requests after a
+    (re)start doesn't serialize on connection handshakes. No-op for SQLite.
+    """
+    if _is_sqlite or not settings.DB_POOL_WARMUP:
+        return
+
+    async def _checkout() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    # Hold all checkouts concurrently so the pool has to open pool_size
+    # distinct connections; they stay pooled once released.
+    await asyncio.gather(*(_checkout() for _ in range(settings.DB_POOL_SIZE)))
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency for getting async database sessions
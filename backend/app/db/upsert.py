@@ -0,0 +1,55 @@
+"""
+Helpers for the Spond sync upserts (INSERT ... ON CONFLICT DO UPDATE)
+"""
+from typing import Any, Dict, Iterable
+import hashlib
+import json
+
+from sqlalchemy import case
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def dialect_insert(db: AsyncSession):
+    """
+    INSERT construct with ON CONFLICT support for the session's dialect
+
+    PostgreSQL in production, SQLite for dev databases; both expose the
+    same on_conflict_do_update / excluded API.
+    """
+    return pg_insert if db.bind.dialect.name == "postgresql" else sqlite_insert
+
+
+def payload_hash(*parts: Any) -> str:
+    """
+    Stable 32-char digest of JSON-serialisable sync payloads
+
+    Stored as ``content_hash`` so a sync can tell rows whose Spond data did
+    not change from ones that did.
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def keep_if_unchanged(model, excluded, fields: Iterable[str]) -> Dict[str, Any]:
+    """
+    DO UPDATE SET entries that keep the stored values when the row's
+    ``content_hash`` matches the incoming one
+
+    On PostgreSQL, assigning a column its own value reuses the stored
+    TOAST datum, so unchanged JSON blobs are not rewritten.
+
+    Args:
+        model: Mapped class with a ``content_hash`` column
+        excluded: ``stmt.excluded`` of the upsert
+        fields: Column names to guard
+
+    Returns:
+        Mapping for ``on_conflict_do_update(set_=...)``
+    """
+    unchanged = model.content_hash == excluded.content_hash
+    return {
+        field: case((unchanged, getattr(model, field)), else_=excluded[field])
+        for field in fields
+    }
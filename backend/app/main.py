@@ -1,7 +1,10 @@
 """
 Archery Club Administration - FastAPI Application
 """
+import atexit
 import logging
+import logging.handlers
+import queue
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
@@ -12,13 +15,24 @@ from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 
 from app.core.config import settings
-from app.db.session import init_db
+from app.db.session import init_db, warm_up_pool
 
-# Configure logging
+# Configure logging. Records go through a QueueHandler so request handlers
+# only enqueue; a listener thread does the blocking stream write.
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+)
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, _log_handler, respect_handler_level=True
+)
 logging.basicConfig(
     level=logging.INFO if not settings.DEBUG else logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    handlers=[logging.handlers.QueueHandler(_log_queue)],
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)  # flush queued records on exit
 logger = logging.getLogger(__name__)
 
 # Initialize rate limiter
@@ -39,6 +53,12 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to initialize database: {e}")
         raise
 
+    try:
+        await warm_up_pool()
+    except Exception as e:
+        # A cold pool only costs latency; don't block startup on it
+        logger.warning(f"Database pool warm-up failed: {e}")
+
     # Start background scheduler
     if settings.AUTO_SYNC_ENABLED:
         from app.services.scheduler_service import scheduler_service
@@ -63,6 +83,13 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"Error stopping background scheduler: {e}")
 
+    # Close the shared Spond HTTP session
+    try:
+        from app.services.spond_service import close_spond_service
+        await close_spond_service()
+    except Exception as e:
+        logger.error(f"Error closing Spond client: {e}")
+
 
 # Create FastAPI application
 app = FastAPI(
@@ -5,6 +5,7 @@ from app.models.admin import Admin, UserRole
 from app.models.access_group import AccessGroup, RoleModuleDefault
 from app.models.event import Event
 from app.models.event_category import EventCategory
+from app.models.event_type_count import EventTypeCount
 from app.models.group import Group
 from app.models.member import Member
 from app.models.group_member import GroupMember
@@ -44,6 +45,7 @@ __all__ = [
     "RoleModuleDefault",
     "Event",
     "EventCategory",
+    "EventTypeCount",
     "Group",
     "Member",
     "GroupMember",
@@ -3,7 +3,7 @@ Event model for caching Spond events
 """
 from datetime import datetime, time
 from typing import Optional
-from sqlalchemy import String, Boolean, DateTime, Text, Time, JSON, func, ForeignKey, Integer
+from sqlalchemy import String, Boolean, DateTime, Text, Time, JSON, func, ForeignKey, Integer, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base, TimestampMixin
@@ -14,6 +14,13 @@ class Event(Base, TimestampMixin):
     Cached event data from Spond API
     """
     __tablename__ = "events"
+    __table_args__ = (
+        # Keyset pagination cursor: (start_time, id) row-value comparisons
+        Index("ix_events_start_time_id", "start_time", "id"),
+    )
+    # Fetch server-generated values (updated_at onupdate, server defaults)
+    # with RETURNING during flush, so writes don't need a db.refresh().
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
 
@@ -28,14 +35,14 @@ class Event(Base, TimestampMixin):
     category_override: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)  # Manual assignment flag
 
     # Event details
-    heading: Mapped[str] = mapped_column(String(500), nullable=False)
+    heading: Mapped[str] = mapped_column(String(500), nullable=False, index=True)
     description: Mapped[str] = mapped_column(Text, nullable=True)
     event_type: Mapped[str] = mapped_column(String(50), nullable=False, index=True)  # AVAILABILITY, EVENT, RECURRING
 
     # Timestamps
     start_time: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
     end_time: Mapped[datetime] = mapped_column(DateTime, nullable=False)
-    created_time: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    created_time: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
     invite_time: Mapped[datetime] = mapped_column(DateTime, nullable=True)
 
     # Status
@@ -69,6 +76,10 @@ class Event(Base, TimestampMixin):
     # Raw data from Spond API
     raw_data: Mapped[dict] = mapped_column(JSON, nullable=True)
 
+    # Digest of raw_data + enriched responses as last written by a sync;
+    # lets the sync skip rewriting events that did not change in Spond
+    content_hash: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)
+
     # Sync metadata
     sync_status: Mapped[str] = mapped_column(
         String(50),
@@ -0,0 +1,37 @@
+"""
+Materialized event-type counts used by the analytics dashboard
+"""
+from datetime import datetime
+from sqlalchemy import String, Integer, DateTime, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class EventTypeCount(Base):
+    """
+    Pre-aggregated COUNT(*) of events per (event_type, group).
+
+    Kept current by AnalyticsService.adjust_event_type_counts, which every
+    event write path (Spond sync, local create/delete) calls with +/- deltas
+    in its own transaction, so reads are a scan over a handful of rows
+    instead of a GROUP BY over all events.
+    """
+    __tablename__ = "event_type_counts"
+
+    event_type: Mapped[str] = mapped_column(String(50), primary_key=True)
+
+    # Group spond_id (raw_data.recipients.group.id); '' for ungrouped events,
+    # since a primary key column cannot be NULL
+    group_id: Mapped[str] = mapped_column(String(255), primary_key=True, server_default="")
+
+    count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    refreshed_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        server_default=func.now(),
+        nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<EventTypeCount {self.event_type} group={self.group_id}: {self.count}>"
@@ -2,9 +2,9 @@
 Group model for caching Spond groups
 """
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import String, Text, JSON, DateTime, func
+from sqlalchemy import String, Text, JSON, DateTime, Integer, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base, TimestampMixin
@@ -19,6 +19,9 @@ class Group(Base, TimestampMixin):
     Cached group data from Spond API
     """
     __tablename__ = "groups"
+    # Fetch server-generated values (updated_at onupdate, server defaults)
+    # with RETURNING during flush, so writes don't need a db.refresh().
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
 
@@ -34,9 +37,19 @@ class Group(Base, TimestampMixin):
     subgroups: Mapped[list] = mapped_column(JSON, default=list, nullable=True)
     field_defs: Mapped[list] = mapped_column(JSON, default=list, nullable=True)
 
+    # len(subgroups), kept in step by the group sync so filters and stats
+    # don't have to measure the JSON array per row
+    subgroup_count: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False, index=True
+    )
+
     # Raw data from Spond API
     raw_data: Mapped[dict] = mapped_column(JSON, nullable=True)
 
+    # Digest of raw_data as last written by a sync; an unchanged payload
+    # only bumps last_synced_at instead of rewriting the row's data
+    content_hash: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)
+
     # Sync metadata
     last_synced_at: Mapped[datetime] = mapped_column(
         DateTime,
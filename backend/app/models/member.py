@@ -2,9 +2,9 @@
 Member model for caching Spond members
 """
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import String, JSON, DateTime, func
+from sqlalchemy import String, JSON, DateTime, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base, TimestampMixin
@@ -23,6 +23,10 @@ class Member(Base, TimestampMixin):
     `subgroup_uids` stored on each association row.
     """
     __tablename__ = "members"
+    __table_args__ = (
+        # Default members list order: ORDER BY last_name, first_name LIMIT n
+        Index("ix_members_last_name_first_name", "last_name", "first_name"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
 
@@ -47,6 +51,10 @@ class Member(Base, TimestampMixin):
     # Raw data from Spond API
     raw_data: Mapped[dict] = mapped_column(JSON, nullable=True)
 
+    # Digest of raw_data as last written by a sync; an unchanged payload
+    # only bumps last_synced_at instead of rewriting the row's data
+    content_hash: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)
+
     # Sync metadata
     last_synced_at: Mapped[datetime] = mapped_column(
         DateTime,
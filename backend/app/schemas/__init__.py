@@ -17,6 +17,10 @@ from app.schemas.event import (
     EventFilters,
     EventStats,
     EventResponseUpdate,
+    EventBulkCreate,
+    EventBulkResponseUpdate,
+    EventBulkResponseResult,
+    EventBulkPushRequest,
     EventSyncResult,
 )
 
@@ -34,5 +38,9 @@ __all__ = [
     "EventFilters",
     "EventStats",
     "EventResponseUpdate",
+    "EventBulkCreate",
+    "EventBulkResponseUpdate",
+    "EventBulkResponseResult",
+    "EventBulkPushRequest",
     "EventSyncResult",
 ]
@@ -153,6 +153,9 @@ class EventFilters(BaseModel):
     """
     Filters for listing events
     """
+    # Frozen (and so hashable) so built filter conditions can be memoized
+    model_config = ConfigDict(frozen=True)
+
     group_id: Optional[str] = None
     subgroup_id: Optional[str] = None
     event_type: Optional[Literal["AVAILABILITY", "EVENT", "RECURRING"]] = None
@@ -199,6 +202,36 @@ class EventResponseUpdate(BaseModel):
     response_type: Literal["accepted", "declined", "unanswered", "waiting_list", "unconfirmed"]
 
 
+class EventBulkResponseUpdate(BaseModel):
+    """
+    Set the same response for several users on one event
+    """
+    user_ids: List[str] = Field(..., min_length=1, max_length=500)
+    response_type: Literal["accepted", "declined", "unanswered", "waiting_list", "unconfirmed"]
+
+
+class EventBulkCreate(BaseModel):
+    """
+    Create several local-only events at once
+    """
+    events: List[EventCreate] = Field(..., min_length=1, max_length=500)
+
+
+class EventBulkPushRequest(BaseModel):
+    """
+    Push several events to Spond
+    """
+    event_ids: List[int] = Field(..., min_length=1, max_length=100)
+
+
+class EventBulkResponseResult(BaseModel):
+    """
+    Result of a bulk response update
+    """
+    updated: int
+    failed_user_ids: List[str]
+
+
 class EventSyncResult(BaseModel):
     """
     Result of event synchronization
@@ -206,5 +239,6 @@ class EventSyncResult(BaseModel):
     total_fetched: int
     created: int
     updated: int
+    skipped: int = 0
     errors: int
     sync_time: datetime
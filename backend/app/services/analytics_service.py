@@ -3,13 +3,17 @@ Analytics Service
 Provides analytics and reporting data
 """
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Any, Optional
-from sqlalchemy import select, func, and_, or_, text
+import heapq
+import time
+from typing import List, Dict, Any, Optional, Tuple
+from sqlalchemy import select, func, and_, or_, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from collections import defaultdict, Counter
 
+from app.db.upsert import dialect_insert
 from app.models.event import Event
 from app.models.event_category import EventCategory
+from app.models.event_type_count import EventTypeCount
 from app.models.group import Group
 from app.models.group_member import GroupMember
 from app.models.member import Member
@@ -27,17 +31,80 @@ from app.schemas.analytics import (
     CategoryResponseRateStats
 )
 
+# In-process TTL cache for the dashboard summary, keyed by group_id. Only
+# the unfiltered (no date/category) variant is cached — that is what the
+# dashboard hits on every page load. Per worker; the events sync clears it
+# once fresh data has landed.
+SUMMARY_TTL_SEC = 30
+_summary_cache: Dict[Optional[str], Tuple[float, AnalyticsSummary]] = {}
+
 
 class AnalyticsService:
     """Service for analytics operations"""
 
+    @staticmethod
+    def invalidate_summary_cache() -> None:
+        """Drop all cached analytics summaries"""
+        _summary_cache.clear()
+
+    @staticmethod
+    async def adjust_event_type_counts(
+        db: AsyncSession,
+        deltas: Dict[Tuple[str, Optional[str]], int],
+    ) -> None:
+        """
+        Apply +/- deltas to the event_type_counts aggregate.
+
+        Called from the event write paths (sync, local create/delete) inside
+        the caller's transaction, so the aggregate commits together with the
+        events. Each delta is one INSERT ... ON CONFLICT DO UPDATE SET
+        count = count + delta, which row-locks its key, so concurrent
+        writers add up instead of overwriting each other.
+
+        An empty aggregate (e.g. a database created by init_db) is rebuilt
+        from events instead, since deltas are only right on top of a
+        correct starting count.
+
+        Args:
+            db: Database session
+            deltas: Count change per (event_type, group_id); ungrouped
+                events use group_id None
+        """
+        rows = [
+            {"event_type": event_type, "group_id": group_id or "", "count": delta}
+            for (event_type, group_id), delta in deltas.items()
+            if delta
+        ]
+        if not rows:
+            return
+
+        if await db.scalar(select(EventTypeCount.event_type).limit(1)) is None:
+            # The events already include the caller's write
+            group_key = func.coalesce(Event.group_id, "")
+            await db.execute(
+                insert(EventTypeCount).from_select(
+                    ["event_type", "group_id", "count"],
+                    select(Event.event_type, group_key, func.count())
+                    .group_by(Event.event_type, group_key)
+                )
+            )
+            return
+
+        stmt = dialect_insert(db)(EventTypeCount.__table__)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[EventTypeCount.event_type, EventTypeCount.group_id],
+            set_={
+                "count": EventTypeCount.count + stmt.excluded.count,
+                "refreshed_at": func.now(),
+            },
+        )
+        await db.execute(stmt, rows)
+
     @staticmethod
     def _apply_event_group_filter(stmt, group_id: Optional[str]):
-        """Apply group filter to event query using JSON extraction from raw_data"""
+        """Apply group filter to event query on the indexed group_id column"""
         if group_id:
-            stmt = stmt.where(
-                text("raw_data #>> '{recipients,group,id}' = :group_id").bindparams(group_id=group_id)
-            )
+            stmt = stmt.where(Event.group_id == group_id)
         return stmt
 
     @staticmethod
@@ -51,30 +118,57 @@ class AnalyticsService:
         Returns:
             List of response dictionaries with 'answer' and 'profile' keys
         """
-        if not event.responses:
+        return AnalyticsService._responses_from_json(event.responses)
+
+    @staticmethod
+    def _responses_from_json(responses: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Same as _get_responses_array, for a bare `responses` column value"""
+        if not responses:
             return []
 
         # New format: has responses array
-        if "responses" in event.responses:
-            return event.responses["responses"]
+        if "responses" in responses:
+            return responses["responses"]
 
         # Old format fallback: construct from UID arrays
         responses_array = []
 
-        for uid in event.responses.get("accepted_uids", []):
+        for uid in responses.get("accepted_uids", []):
             responses_array.append({"answer": "accepted", "profile": {"id": uid}})
 
-        for uid in event.responses.get("declined_uids", []):
+        for uid in responses.get("declined_uids", []):
             responses_array.append({"answer": "declined", "profile": {"id": uid}})
 
-        for uid in event.responses.get("unanswered_uids", []):
+        for uid in responses.get("unanswered_uids", []):
             responses_array.append({"answer": "unanswered", "profile": {"id": uid}})
 
-        for uid in event.responses.get("waiting_list_uids", []):
+        for uid in responses.get("waiting_list_uids", []):
             responses_array.append({"answer": "waitinglistavailable", "profile": {"id": uid}})
 
         return responses_array
 
+    @staticmethod
+    def _build_response_rate_data(
+        accepted: int,
+        declined: int,
+        unanswered: int,
+        no_answer: int
+    ) -> ResponseRateData:
+        """Build ResponseRateData from the four answer buckets"""
+        total_responses = accepted + declined + unanswered + no_answer
+        scale = (100 / total_responses) if total_responses > 0 else 0
+
+        return ResponseRateData(
+            total_responses=total_responses,
+            accepted=accepted,
+            declined=declined,
+            unanswered=unanswered,
+            no_answer=no_answer,
+            accepted_percentage=round(accepted * scale, 2),
+            declined_percentage=round(declined * scale, 2),
+            response_rate=round((accepted + declined) * scale, 2)
+        )
+
     async def get_attendance_trends(
         self,
         db: AsyncSession,
@@ -166,7 +260,8 @@ class AnalyticsService:
     ) -> ResponseRateData:
         """Get overall response rate statistics"""
 
-        stmt = select(Event)
+        # Only the responses column is needed — skip hydrating full events
+        stmt = select(Event.responses)
         if start_date and end_date:
             stmt = stmt.where(
                 and_(
@@ -179,44 +274,21 @@ class AnalyticsService:
         stmt = self._apply_event_group_filter(stmt, group_id)
 
         result = await db.execute(stmt)
-        events = result.scalars().all()
-
-        total_responses = 0
-        accepted = 0
-        declined = 0
-        unanswered = 0
-        no_answer = 0
 
-        for event in events:
+        # Single pass: tally raw answers, then fold them into the buckets
+        answers: Counter = Counter()
+        for responses in result.scalars():
             # Use helper to support both old and new response formats
-            for response in self._get_responses_array(event):
-                total_responses += 1
-                answer = response.get("answer", "").lower()
-
-                if answer == "accepted":
-                    accepted += 1
-                elif answer == "declined":
-                    declined += 1
-                elif answer in ["unanswered", "waitinglistavailable", "waiting"]:
-                    unanswered += 1
-                else:
-                    no_answer += 1
+            answers.update(
+                (r.get("answer") or "").lower() for r in self._responses_from_json(responses)
+            )
 
-        # Calculate percentages
-        accepted_percentage = (accepted / total_responses * 100) if total_responses > 0 else 0
-        declined_percentage = (declined / total_responses * 100) if total_responses > 0 else 0
-        response_rate = ((accepted + declined) / total_responses * 100) if total_responses > 0 else 0
+        accepted = answers.pop("accepted", 0)
+        declined = answers.pop("declined", 0)
+        unanswered = sum(answers.pop(a, 0) for a in ("unanswered", "waitinglistavailable", "waiting"))
+        no_answer = sum(answers.values())
 
-        return ResponseRateData(
-            total_responses=total_responses,
-            accepted=accepted,
-            declined=declined,
-            unanswered=unanswered,
-            no_answer=no_answer,
-            accepted_percentage=round(accepted_percentage, 2),
-            declined_percentage=round(declined_percentage, 2),
-            response_rate=round(response_rate, 2)
-        )
+        return self._build_response_rate_data(accepted, declined, unanswered, no_answer)
 
     async def get_event_type_distribution(
         self,
@@ -225,24 +297,39 @@ class AnalyticsService:
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None
     ) -> List[EventTypeDistribution]:
-        """Get distribution of event types"""
+        """
+        Get distribution of event types
+
+        Without a date range this reads the event_type_counts aggregate.
+        It is exact as of the last committed event write that went through
+        the sync or EventService (see adjust_event_type_counts); writes made
+        around them, e.g. by hand in SQL, are not reflected. Date-ranged
+        queries, and an empty aggregate, fall back to a live GROUP BY over
+        events.
+        """
+        type_counts = []
+        if not start_date and not end_date:
+            agg_stmt = select(
+                EventTypeCount.event_type, func.sum(EventTypeCount.count)
+            ).group_by(EventTypeCount.event_type).having(func.sum(EventTypeCount.count) > 0)
+            if group_id:
+                agg_stmt = agg_stmt.where(EventTypeCount.group_id == group_id)
+            type_counts = (await db.execute(agg_stmt)).all()
 
-        stmt = select(Event.event_type, func.count(Event.id)).group_by(Event.event_type)
+        if not type_counts:
+            stmt = select(Event.event_type, func.count(Event.id)).group_by(Event.event_type)
 
-        # Apply group filter
-        if group_id:
-            stmt = stmt.where(
-                text("raw_data #>> '{recipients,group,id}' = :group_id").bindparams(group_id=group_id)
-            )
+            # Apply group filter
+            stmt = self._apply_event_group_filter(stmt, group_id)
 
-        # Apply date range filters
-        if start_date:
-            stmt = stmt.where(Event.start_time >= start_date)
-        if end_date:
-            stmt = stmt.where(Event.start_time <= end_date)
+            # Apply date range filters
+            if start_date:
+                stmt = stmt.where(Event.start_time >= start_date)
+            if end_date:
+                stmt = stmt.where(Event.start_time <= end_date)
 
-        result = await db.execute(stmt)
-        type_counts = result.all()
+            result = await db.execute(stmt)
+            type_counts = result.all()
 
         total_events = sum(count for _, count in type_counts)
 
@@ -293,60 +380,67 @@ class AnalyticsService:
         events_result = await db.execute(events_stmt)
         events = events_result.scalars().all()
 
-        # Build participation stats
-        member_stats: Dict[str, Dict[str, Any]] = {}
-
-        for member in members:
+        # Map each member's matching key to an index into parallel counter
+        # lists, so the per-response hot loop does a single int-indexed
+        # increment instead of nested dict lookups.
+        idx_by_profile: Dict[str, int] = {}
+        for i, member in enumerate(members):
             # Use profile ID for matching with event responses (profile.id != spond_id)
             profile = member.raw_data.get("profile", {}) if member.raw_data else {}
-            member_id = profile.get("id") or member.spond_id
-            member_stats[member_id] = {
-                "member_id": member.id,
-                "member_name": f"{member.first_name} {member.last_name}",
-                "total_events": 0,
-                "attended": 0,
-                "declined": 0,
-                "no_response": 0
-            }
+            idx_by_profile[profile.get("id") or member.spond_id] = i
+
+        n = len(members)
+        totals = [0] * n
+        attended = [0] * n
+        declined = [0] * n
+        no_response = [0] * n
 
         # Count responses for each member using helper (supports both old and new formats)
         for event in events:
             for response in self._get_responses_array(event):
-                profile_id = response.get("profile", {}).get("id")
-
-                if profile_id in member_stats:
-                    member_stats[profile_id]["total_events"] += 1
+                # EAFP: avoids allocating a default {} per response
+                try:
+                    i = idx_by_profile.get(response["profile"]["id"])
+                except (KeyError, TypeError):
+                    continue
+                if i is None:
+                    continue
 
-                    answer = response.get("answer", "").lower()
-                    if answer == "accepted":
-                        member_stats[profile_id]["attended"] += 1
-                    elif answer == "declined":
-                        member_stats[profile_id]["declined"] += 1
-                    else:
-                        member_stats[profile_id]["no_response"] += 1
+                totals[i] += 1
+                try:
+                    answer = response["answer"].lower()
+                except (KeyError, AttributeError):
+                    answer = ""
+                if answer == "accepted":
+                    attended[i] += 1
+                elif answer == "declined":
+                    declined[i] += 1
+                else:
+                    no_response[i] += 1
 
         # Create participation stats
         participation_stats = []
-        for stats in member_stats.values():
-            if stats["total_events"] > 0:
-                attendance_rate = (stats["attended"] / stats["total_events"] * 100)
+        for i in idx_by_profile.values():
+            if totals[i] > 0:
+                member = members[i]
                 participation_stats.append(
                     MemberParticipationStat(
-                        member_id=stats["member_id"],
-                        member_name=stats["member_name"],
-                        total_events=stats["total_events"],
-                        attended=stats["attended"],
-                        declined=stats["declined"],
-                        no_response=stats["no_response"],
-                        attendance_rate=round(attendance_rate, 2)
+                        member_id=member.id,
+                        member_name=f"{member.first_name} {member.last_name}",
+                        total_events=totals[i],
+                        attended=attended[i],
+                        declined=declined[i],
+                        no_response=no_response[i],
+                        attendance_rate=round(attended[i] / totals[i] * 100, 2)
                     )
                 )
 
-        # Sort by actual attendance (most active = most attended events)
-        participation_stats.sort(key=lambda x: x.attended, reverse=True)
+        # Top N by actual attendance (most active = most attended events).
+        # nlargest is O(n log limit) and skips sorting the whole list.
+        top_members = heapq.nlargest(limit, participation_stats, key=lambda x: x.attended)
 
         return MemberParticipationResponse(
-            members=participation_stats[:limit],
+            members=top_members,
             total=len(participation_stats)
         )
 
@@ -445,12 +539,15 @@ class AnalyticsService:
     ) -> AnalyticsSummary:
         """Get overall analytics summary"""
 
+        cacheable = not (category_ids or exclude_category_ids or start_date or end_date)
+        if cacheable:
+            cached = _summary_cache.get(group_id)
+            if cached and time.monotonic() - cached[0] < SUMMARY_TTL_SEC:
+                return cached[1]
+
         # Get counts (with group and date filters if specified)
         events_stmt = select(func.count(Event.id))
-        if group_id:
-            events_stmt = events_stmt.where(
-                text("raw_data #>> '{recipients,group,id}' = :group_id").bindparams(group_id=group_id)
-            )
+        events_stmt = self._apply_event_group_filter(events_stmt, group_id)
         # Apply date range filters
         if start_date:
             events_stmt = events_stmt.where(Event.start_time >= start_date)
@@ -473,10 +570,7 @@ class AnalyticsService:
             # Upcoming events
             now = datetime.now(timezone.utc)
             upcoming_stmt = select(func.count(Event.id)).where(Event.start_time >= now)
-            if group_id:
-                upcoming_stmt = upcoming_stmt.where(
-                    text("raw_data #>> '{recipients,group,id}' = :group_id").bindparams(group_id=group_id)
-                )
+            upcoming_stmt = self._apply_event_group_filter(upcoming_stmt, group_id)
             # Apply category filters to upcoming events too
             if category_ids:
                 upcoming_stmt = upcoming_stmt.where(Event.category_id.in_(category_ids))
@@ -523,7 +617,7 @@ class AnalyticsService:
             end_date=end_date
         )
 
-        return AnalyticsSummary(
+        summary = AnalyticsSummary(
             total_events=total_events,
             upcoming_events=upcoming_events,
             past_events=past_events,
@@ -534,6 +628,16 @@ class AnalyticsService:
             event_type_distribution=event_distribution
         )
 
+        if cacheable:
+            now = time.monotonic()
+            # Drop expired entries: group_id comes from the client, so keys
+            # that are never asked for again must not pile up
+            for key in [k for k, (at, _) in _summary_cache.items() if now - at >= SUMMARY_TTL_SEC]:
+                del _summary_cache[key]
+            _summary_cache[group_id] = (now, summary)
+
+        return summary
+
     async def get_category_distribution(
         self,
         db: AsyncSession,
@@ -838,17 +942,13 @@ class AnalyticsService:
         events = result.scalars().all()
 
         # Calculate response rates
-        total_responses = 0
         accepted = 0
         declined = 0
         unanswered = 0
         no_answer = 0
 
         for event in events:
-            responses = self._get_responses_array(event)
-            total_responses += len(responses)
-
-            for resp in responses:
+            for resp in self._get_responses_array(event):
                 answer = resp.get("answer", "").lower()
                 if answer == "accepted":
                     accepted += 1
@@ -859,21 +959,7 @@ class AnalyticsService:
                 else:
                     no_answer += 1
 
-        # Calculate percentages
-        accepted_pct = (accepted / total_responses * 100) if total_responses > 0 else 0
-        declined_pct = (declined / total_responses * 100) if total_responses > 0 else 0
-        response_rate = ((accepted + declined) / total_responses * 100) if total_responses > 0 else 0
-
-        response_data = ResponseRateData(
-            total_responses=total_responses,
-            accepted=accepted,
-            declined=declined,
-            unanswered=unanswered,
-            no_answer=no_answer,
-            accepted_percentage=round(accepted_pct, 2),
-            declined_percentage=round(declined_pct, 2),
-            response_rate=round(response_rate, 2)
-        )
+        response_data = self._build_response_rate_data(accepted, declined, unanswered, no_answer)
 
         return CategoryResponseRateStats(
             category_id=category_id,
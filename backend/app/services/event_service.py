@@ -1,25 +1,66 @@
 """
 Event service for CRUD operations
 """
-from typing import Optional, List, Tuple
+from typing import AsyncIterator, Dict, Optional, List, Set, Tuple
+from collections import Counter
 from datetime import datetime, timezone
+import asyncio
+import functools
 import logging
 
-from sqlalchemy import select, func, or_, and_, text
+from sqlalchemy import select, func, or_, and_, case, tuple_, lambda_stmt, insert as sa_insert, update as sa_update, delete as sa_delete
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
+from app.db.functions import utcnow
 from app.models.event import Event
 from app.models.group import Group
 from app.models.group_member import GroupMember
 from app.models.member import Member
 from app.models.training_shift import TrainingShift
 from app.schemas.event import EventCreate, EventUpdate, EventFilters
+from app.services.analytics_service import AnalyticsService
 from app.services.spond_event_create_service import _compute_invite_send_at
 from app.services.spond_service import SpondService
 import uuid
 
 logger = logging.getLogger(__name__)
 
+# Plain columns EventUpdate can set directly (None means "leave unchanged")
+_UPDATABLE_FIELDS = (
+    "heading",
+    "description",
+    "start_time",
+    "end_time",
+    "location_address",
+    "location_latitude",
+    "location_longitude",
+    "max_accepted",
+    "cancelled",
+    "hidden",
+    "invite_lead_days",
+    "invite_send_time",
+)
+
+# Key in AsyncSession.info for the request-scoped member profile lookups:
+# spond_id -> (id, first_name, last_name, email) or None
+_MEMBER_PROFILES_INFO_KEY = "event_member_profiles"
+
+# ORDER BY clauses keyed by (order_by, order_desc). Only indexed columns are
+# sortable; built once at import rather than per list call. Event.id breaks
+# ties so pages (and keyset cursors) are stable.
+_ORDER_CLAUSES = {
+    (name, desc): (
+        (column.desc(), Event.id.desc()) if desc else (column.asc(), Event.id.asc())
+    )
+    for name, column in (
+        ("start_time", Event.start_time),
+        ("created_time", Event.created_time),
+        ("heading", Event.heading),
+    )
+    for desc in (True, False)
+}
+
 
 class EventService:
     """
@@ -39,10 +80,10 @@ class EventService:
         Returns:
             Event or None
         """
-        result = await db.execute(
-            select(Event).where(Event.id == event_id)
-        )
-        event = result.scalar_one_or_none()
+        # Session.get consults the identity map first, so repeat lookups of
+        # the same event within one request (update -> push_to_spond, the
+        # attendance export route) are served without another SELECT.
+        event = await db.get(Event, event_id)
 
         if event and enrich_responses:
             event = await EventService._enrich_event_responses(db, event)
@@ -76,54 +117,112 @@ class EventService:
             e.linked_shift_id = lookup.get(e.spond_id)
 
     @staticmethod
-    async def _enrich_event_responses(db: AsyncSession, event: Event) -> Event:
+    async def _lookup_member_profiles(
+        db: AsyncSession, spond_ids: Set[str]
+    ) -> Dict[str, Tuple[int, Optional[str], Optional[str], Optional[str]]]:
         """
-        Enrich event responses with member profile data from the members table.
+        Resolve member spond_ids to (id, first_name, last_name, email)
+
+        Memoized on the session (one per request), so a member is queried
+        at most once per request, and nothing outlives the request to go
+        stale after a member sync or edit. Only ids not
+        seen yet are queried, in one batched SELECT of just those columns.
 
         Args:
             db: Database session
-            event: Event to enrich
+            spond_ids: Member Spond IDs
 
         Returns:
-            Event with enriched responses
+            Dictionary of spond_id to profile tuple for ids found locally
         """
-        if not event.responses:
-            return event
+        cache: Dict[str, Optional[tuple]] = db.info.setdefault(_MEMBER_PROFILES_INFO_KEY, {})
+        missing = [spond_id for spond_id in spond_ids if spond_id not in cache]
 
-        responses_array = event.responses.get("responses", [])
-
-        # The group-member id lives on each response's top-level `id` — that's
-        # what matches Member.spond_id. (profile.id is a *different*, profile
-        # identifier and does not match the members table.)
-        member_spond_ids = {r.get("id") for r in responses_array if r.get("id")}
-        members: dict = {}
-        if member_spond_ids:
+        if missing:
             result = await db.execute(
-                select(Member).where(Member.spond_id.in_(member_spond_ids))
+                select(
+                    Member.spond_id,
+                    Member.id,
+                    Member.first_name,
+                    Member.last_name,
+                    Member.email,
+                ).where(Member.spond_id.in_(missing))
             )
-            members = {m.spond_id: m for m in result.scalars().all()}
+            found = {spond_id: tuple(rest) for spond_id, *rest in result.tuples()}
+            # Unknown ids are remembered too, so non-members aren't re-queried
+            for spond_id in missing:
+                cache[spond_id] = found.get(spond_id)
+
+        profiles = {}
+        for spond_id in spond_ids:
+            profile = cache[spond_id]
+            if profile is not None:
+                profiles[spond_id] = profile
 
+        return profiles
+
+    @staticmethod
+    def _apply_member_profiles(event: Event, profiles: Dict[str, tuple]) -> None:
+        """Rewrite event.responses with member_id and local name/email fallbacks."""
         enriched_responses = []
-        for response in responses_array:
-            member = members.get(response.get("id"))
-            profile = dict(response.get("profile") or {})
+        for response in event.responses.get("responses", []):
+            member = profiles.get(response.get("id"))
+            profile = response.get("profile") or {}
             if member is not None:
+                # Copy only when there is something to add
+                profile = dict(profile)
+                member_id, first_name, last_name, email = member
                 # Local members.id so the UI can deep-link to the member detail
                 # page (/dashboard/members/{member_id}).
-                profile["member_id"] = member.id
+                profile["member_id"] = member_id
                 # Fall back to authoritative local names/email when the synced
                 # profile is missing them.
-                profile.setdefault("firstName", member.first_name)
-                profile.setdefault("lastName", member.last_name)
-                profile.setdefault("email", member.email)
+                profile.setdefault("firstName", first_name)
+                profile.setdefault("lastName", last_name)
+                profile.setdefault("email", email)
             enriched_responses.append({
                 "answer": response.get("answer"),
                 "profile": profile,
             })
 
-        enriched = dict(event.responses)
-        enriched["responses"] = enriched_responses
-        event.responses = enriched
+        # Plain JSON column (no mutation tracking): assign a new dict so the
+        # change is seen, copying only the top level once.
+        event.responses = {**event.responses, "responses": enriched_responses}
+
+    @staticmethod
+    def _response_member_ids(event: Event) -> Set[str]:
+        # The group-member id lives on each response's top-level `id` — that's
+        # what matches Member.spond_id. (profile.id is a *different*, profile
+        # identifier and does not match the members table.)
+        return {
+            r.get("id")
+            for r in event.responses.get("responses", [])
+            if r.get("id")
+        }
+
+    @staticmethod
+    async def _enrich_event_responses(db: AsyncSession, event: Event) -> Event:
+        """
+        Enrich event responses with member profile data from the members table.
+
+        Args:
+            db: Database session
+            event: Event to enrich
+
+        Returns:
+            Event with enriched responses
+        """
+        if not event.responses:
+            return event
+
+        # Entries are always reshaped to {answer, profile}; only the member
+        # lookup is skipped when no response carries an id
+        member_ids = EventService._response_member_ids(event)
+        profiles = (
+            await EventService._lookup_member_profiles(db, member_ids)
+            if member_ids else {}
+        )
+        EventService._apply_member_profiles(event, profiles)
 
         return event
 
@@ -139,8 +238,10 @@ class EventService:
         Returns:
             Event or None
         """
+        # lambda_stmt caches the constructed statement by the lambda's code
+        # location, so repeat calls skip building and compiling the Select.
         result = await db.execute(
-            select(Event).where(Event.spond_id == spond_id)
+            lambda_stmt(lambda: select(Event).where(Event.spond_id == spond_id))
         )
         return result.scalar_one_or_none()
 
@@ -152,6 +253,7 @@ class EventService:
         limit: int = 100,
         order_by: str = "start_time",
         order_desc: bool = True,
+        after: Optional[Tuple[datetime, int]] = None,
     ) -> Tuple[List[Event], int]:
         """
         Get all events with filtering and pagination
@@ -163,44 +265,116 @@ class EventService:
             limit: Maximum number of records to return
             order_by: Field to order by
             order_desc: Order descending if True
+            after: Keyset cursor (start_time, id) of the last event on the
+                previous page; only valid when ordering by start_time
 
         Returns:
-            Tuple of (list of events, total count)
+            Tuple of (list of events, total count). With a cursor, the
+            total counts the events after it.
         """
-        # Build query
-        query = select(Event)
-        count_query = select(func.count(Event.id))
+        # The total rides along on every row as a window count over the
+        # filtered set, so one round trip returns both.
+        query = select(Event, func.count().over().label("full_count"))
 
         # Apply filters
-        if filters:
-            conditions = EventService._build_filter_conditions(filters)
-            if conditions:
-                query = query.where(and_(*conditions))
-                count_query = count_query.where(and_(*conditions))
-
-        # Get total count
-        total_result = await db.execute(count_query)
-        total = total_result.scalar()
-
-        # Apply ordering
-        order_column = getattr(Event, order_by, Event.start_time)
-        if order_desc:
-            query = query.order_by(order_column.desc())
-        else:
-            query = query.order_by(order_column.asc())
+        conditions = EventService._list_conditions(filters, order_by, order_desc, after)
+        if conditions:
+            query = query.where(and_(*conditions))
+
+        # Apply ordering (whitelisted; unknown columns fall back to newest first)
+        query = query.order_by(
+            *_ORDER_CLAUSES.get((order_by, order_desc), _ORDER_CLAUSES[("start_time", True)])
+        )
 
         # Apply pagination
         query = query.offset(skip).limit(limit)
 
         # Execute query
-        result = await db.execute(query)
-        events = list(result.scalars().all())
+        rows = (await db.execute(query)).all()
+        events = [row[0] for row in rows]
+
+        if rows:
+            total = rows[0].full_count
+        else:
+            total = await EventService._count_all(
+                db, filters, skip, after, order_by=order_by, order_desc=order_desc
+            )
 
         # Attach linked_shift_id (computed at query time — no FK column).
         await EventService._attach_linked_shift_ids(db, events)
 
         return events, total
 
+    @staticmethod
+    async def _count_all(
+        db: AsyncSession,
+        filters: Optional[EventFilters] = None,
+        skip: int = 0,
+        after: Optional[Tuple[datetime, int]] = None,
+        order_by: str = "start_time",
+        order_desc: bool = True,
+    ) -> int:
+        """
+        Total for a page that returned no rows (and so no window count)
+
+        Args:
+            db: Database session
+            filters: Optional filters
+            skip: Number of records skipped
+            after: Keyset cursor (start_time, id), see get_all
+            order_by: Field the page was ordered by
+            order_desc: Whether the page was ordered descending; decides
+                which side of the cursor is counted
+
+        Returns:
+            Total count of the filtered set
+        """
+        if not skip:
+            return 0
+
+        # Page past the end: no row to carry the count, ask directly
+        count_query = select(func.count(Event.id))
+        conditions = EventService._list_conditions(filters, order_by, order_desc, after)
+        if conditions:
+            count_query = count_query.where(and_(*conditions))
+
+        return (await db.execute(count_query)).scalar()
+
+    @staticmethod
+    def _list_conditions(
+        filters: Optional[EventFilters],
+        order_by: str,
+        order_desc: bool,
+        after: Optional[Tuple[datetime, int]],
+    ) -> List:
+        """
+        Filter conditions plus the keyset cursor predicate for list queries
+
+        Args:
+            filters: Optional filters
+            order_by: Field to order by
+            order_desc: Order descending if True
+            after: Keyset cursor (start_time, id), see get_all
+
+        Returns:
+            List of SQLAlchemy filter conditions
+
+        Raises:
+            ValueError: If a cursor is given for an ordering other than start_time
+        """
+        conditions = EventService._build_filter_conditions(filters) if filters else []
+
+        if after is not None:
+            if order_by != "start_time":
+                raise ValueError("Cursor pagination requires order_by=start_time")
+            # Row-value comparison matches the (start_time, id) index order,
+            # so the page starts with an index seek instead of an OFFSET scan.
+            position = tuple_(Event.start_time, Event.id)
+            cursor = tuple_(*after)
+            conditions.append(position < cursor if order_desc else position > cursor)
+
+        return conditions
+
     @staticmethod
     def _build_filter_conditions(filters: EventFilters) -> List:
         """
@@ -212,12 +386,27 @@ class EventService:
         Returns:
             List of SQLAlchemy filter conditions
         """
+        # Fresh list per call: callers append their own conditions
+        return list(EventService._filter_conditions(filters))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _filter_conditions(filters: EventFilters) -> Tuple:
+        """Filter conditions memoized per (frozen, hashable) EventFilters value."""
         conditions = []
 
+        # Ordered cheapest/most selective first: equality, boolean flags,
+        # ranges, and the unanchored ILIKE search last.
+
         # Filter by event type
         if filters.event_type:
             conditions.append(Event.event_type == filters.event_type)
 
+        # Filter by group_id (indexed column, kept in step with
+        # raw_data.recipients.group.id by sync/create/push)
+        if filters.group_id:
+            conditions.append(Event.group_id == filters.group_id)
+
         # Include/exclude cancelled
         if not filters.include_cancelled:
             conditions.append(Event.cancelled.is_(False))
@@ -226,10 +415,6 @@ class EventService:
         if not filters.include_hidden:
             conditions.append(Event.hidden.is_(False))
 
-        # Include/exclude archived (events where end_time has passed)
-        if not filters.include_archived:
-            conditions.append(Event.end_time >= datetime.utcnow())
-
         # Filter by date range
         if filters.start_date:
             conditions.append(Event.start_time >= filters.start_date)
@@ -237,9 +422,16 @@ class EventService:
         if filters.end_date:
             conditions.append(Event.start_time <= filters.end_date)
 
-        # Search in heading or description
-        if filters.search:
-            search_term = f"%{filters.search}%"
+        # Include/exclude archived (events where end_time has passed)
+        if not filters.include_archived:
+            conditions.append(Event.end_time >= utcnow())
+
+        # Search in heading or description (whitespace-only search is a no-op).
+        # On PostgreSQL the pg_trgm GIN indexes on both columns serve these
+        # unanchored ILIKEs.
+        search = filters.search.strip() if filters.search else ""
+        if search:
+            search_term = f"%{search}%"
             conditions.append(
                 or_(
                     Event.heading.ilike(search_term),
@@ -247,13 +439,7 @@ class EventService:
                 )
             )
 
-        # Filter by group_id (stored in raw_data JSON as recipients.group.id)
-        if filters.group_id:
-            conditions.append(
-                text("raw_data #>> '{recipients,group,id}' = :group_id").bindparams(group_id=filters.group_id)
-            )
-
-        return conditions
+        return tuple(conditions)
 
     @staticmethod
     async def update(
@@ -274,129 +460,104 @@ class EventService:
         Returns:
             Updated event or None if not found
         """
-        event = await EventService.get_by_id(db, event_id)
+        wants_sync = bool(update_data.sync_to_spond and spond_service)
+
+        # Local field changes. The audience override and invite scheduling
+        # intent are local-only on PUT as well — pushed to Spond by the
+        # separate `/push-to-spond` action so admins always opt in
+        # explicitly. Same semantics as start_time / heading updates.
+        values = {
+            field: getattr(update_data, field)
+            for field in _UPDATABLE_FIELDS
+            if getattr(update_data, field) is not None
+        }
+        if update_data.invited_subgroup_uids is not None:
+            values["invited_subgroup_uids"] = update_data.invited_subgroup_uids or None
+
+        event = None
+        if values:
+            # Skip the write when the caller only resent current values: the
+            # row must differ in at least one column. JSON columns have no
+            # equality operator on PostgreSQL, so a subgroup change always
+            # counts as a change.
+            stmt = sa_update(Event).where(Event.id == event_id)
+            if "invited_subgroup_uids" not in values:
+                stmt = stmt.where(or_(*(
+                    getattr(Event, field).is_distinct_from(value)
+                    for field, value in values.items()
+                )))
+            if not wants_sync:
+                # Mark as pending if not syncing immediately
+                values["sync_status"] = case(
+                    (Event.sync_status == "synced", "pending"),
+                    else_=Event.sync_status,
+                )
+            # One UPDATE ... RETURNING instead of SELECT + UPDATE + re-SELECT;
+            # the returned row lands in the identity map fully loaded.
+            result = await db.execute(
+                stmt
+                .values(**values)
+                .returning(Event)
+                .execution_options(populate_existing=True)
+            )
+            event = result.scalar_one_or_none()
+            if event is not None:
+                await EventService._attach_linked_shift_ids(db, [event])
+        if event is None:
+            # Missing row, or nothing actually changed
+            event = await EventService.get_by_id(db, event_id)
         if not event:
             return None
 
-        # Track if any changes were made
-        has_changes = False
-
-        # Update local fields
-        if update_data.heading is not None:
-            event.heading = update_data.heading
-            has_changes = True
-
-        if update_data.description is not None:
-            event.description = update_data.description
-            has_changes = True
-
-        if update_data.start_time is not None:
-            event.start_time = update_data.start_time
-            has_changes = True
-
-        if update_data.end_time is not None:
-            event.end_time = update_data.end_time
-            has_changes = True
-
-        if update_data.location_address is not None:
-            event.location_address = update_data.location_address
-            has_changes = True
-
-        if update_data.location_latitude is not None:
-            event.location_latitude = update_data.location_latitude
-            has_changes = True
-
-        if update_data.location_longitude is not None:
-            event.location_longitude = update_data.location_longitude
-            has_changes = True
-
-        if update_data.max_accepted is not None:
-            event.max_accepted = update_data.max_accepted
-            has_changes = True
-
-        if update_data.cancelled is not None:
-            event.cancelled = update_data.cancelled
-            has_changes = True
-
-        if update_data.hidden is not None:
-            event.hidden = update_data.hidden
-            has_changes = True
-
-        # Audience override (multi-subgroup) — local-only on PUT. Pushed to
-        # Spond by the separate `/push-to-spond` action so admins always opt
-        # in explicitly. Same semantics as start_time / heading updates.
-        if update_data.invited_subgroup_uids is not None:
-            event.invited_subgroup_uids = update_data.invited_subgroup_uids or None
-            has_changes = True
-
-        # Invite scheduling intent — same local-only-on-PUT semantics.
-        if update_data.invite_lead_days is not None:
-            event.invite_lead_days = update_data.invite_lead_days
-            has_changes = True
-
-        if update_data.invite_send_time is not None:
-            event.invite_send_time = update_data.invite_send_time
-            has_changes = True
-
-        # Handle attendees and owners updates if syncing to Spond
+        # Handle attendees and owners updates if syncing to Spond, in a
+        # single Spond update so neither overwrites the other
         if update_data.sync_to_spond and spond_service and event.sync_status != "local_only":
+            member_ids = None
+            group_id = None
+
             # Update attendees if provided
             if update_data.invited_member_ids is not None:
-                try:
-                    # Get group_id from raw_data
-                    group_id = None
-                    if event.raw_data and isinstance(event.raw_data, dict):
-                        recipients = event.raw_data.get("recipients", {})
-                        if isinstance(recipients, dict):
-                            group = recipients.get("group", {})
-                            if isinstance(group, dict):
-                                group_id = group.get("id")
-
-                    if group_id:
-                        await spond_service.update_event_attendees(
-                            event.spond_id,
-                            update_data.invited_member_ids,
-                            group_id
-                        )
-                        has_changes = True
-                        logger.info(f"Updated attendees for event {event.spond_id}")
-                    else:
-                        logger.warning(f"Cannot update attendees: no group_id found for event {event.spond_id}")
-                except Exception as e:
-                    logger.error(f"Failed to update attendees: {e}")
-                    event.sync_status = "error"
-                    event.sync_error = str(e)
+                # Get group_id from raw_data
+                if event.raw_data and isinstance(event.raw_data, dict):
+                    recipients = event.raw_data.get("recipients", {})
+                    if isinstance(recipients, dict):
+                        group = recipients.get("group", {})
+                        if isinstance(group, dict):
+                            group_id = group.get("id")
+
+                if group_id:
+                    member_ids = update_data.invited_member_ids
+                else:
+                    logger.warning("Cannot update attendees: no group_id found for event %s", event.spond_id)
 
-            # Update owners if provided
-            if update_data.owner_ids is not None:
+            if member_ids is not None or update_data.owner_ids is not None:
                 try:
-                    await spond_service.update_event_owners(
+                    await spond_service.update_event_fields(
                         event.spond_id,
-                        update_data.owner_ids
+                        member_ids=member_ids,
+                        group_id=group_id,
+                        owner_ids=update_data.owner_ids,
                     )
-                    has_changes = True
-                    logger.info(f"Updated owners for event {event.spond_id}")
                 except Exception as e:
-                    logger.error(f"Failed to update owners: {e}")
+                    logger.error("Failed to update attendees/owners: %s", e)
                     event.sync_status = "error"
                     event.sync_error = str(e)
 
-        # Update sync status
-        if has_changes:
-            if update_data.sync_to_spond and spond_service and event.sync_status != "local_only":
-                # Sync immediately to Spond
-                try:
-                    await EventService.push_to_spond(db, event_id, spond_service)
-                except Exception as e:
-                    logger.error(f"Failed to sync event to Spond: {e}")
-                    event.sync_status = "error"
-                    event.sync_error = str(e)
-            elif event.sync_status == "synced":
-                # Mark as pending if not syncing immediately
-                event.sync_status = "pending"
-
-        await db.flush()
-        await db.refresh(event)
+        # Sync immediately to Spond. Pushed even when no local column
+        # changed: resending the form is how a failed push gets retried.
+        if wants_sync and event.sync_status != "local_only":
+            try:
+                await EventService.push_to_spond(db, event_id, spond_service)
+            except Exception as e:
+                logger.error("Failed to sync event to Spond: %s", e)
+                event.sync_status = "error"
+                event.sync_error = str(e)
+
+        # Only error bookkeeping above touches the ORM object after the
+        # RETURNING load; flush just when it did (eager_defaults brings the
+        # new updated_at back on the same UPDATE).
+        if db.is_modified(event):
+            await db.flush()
 
         return event
 
@@ -412,12 +573,17 @@ class EventService:
         Returns:
             True if deleted, False if not found
         """
-        event = await EventService.get_by_id(db, event_id)
-        if not event:
+        # Single DELETE ... RETURNING: existence check and delete in one
+        # round-trip, without loading the row
+        deleted = (await db.execute(
+            sa_delete(Event)
+            .where(Event.id == event_id)
+            .returning(Event.event_type, Event.group_id)
+        )).one_or_none()
+        if deleted is None:
             return False
 
-        await db.delete(event)
-        await db.flush()
+        await AnalyticsService.adjust_event_type_counts(db, {tuple(deleted): -1})
 
         return True
 
@@ -476,7 +642,9 @@ class EventService:
         Returns:
             Created event
         """
-        now = datetime.utcnow()
+        # Tz-naive UTC, computed once: the event columns are TIMESTAMP
+        # WITHOUT TIME ZONE, and asyncpg rejects aware values for them.
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
 
         # Generate a temporary spond_id for local-only events
         temp_spond_id = f"local_{uuid.uuid4().hex[:12]}"
@@ -560,10 +728,10 @@ class EventService:
                 )
                 spond_id = result.get("id", temp_spond_id)
                 sync_status = "synced"
-                logger.info(f"Created event in Spond: {spond_id}")
+                logger.info("Created event in Spond: %s", spond_id)
 
             except Exception as e:
-                logger.error(f"Failed to create event in Spond: {e}")
+                logger.error("Failed to create event in Spond: %s", e)
                 sync_status = "error"
                 # Continue with local creation
 
@@ -608,11 +776,98 @@ class EventService:
 
         db.add(event)
         await db.flush()
-        await db.refresh(event)
+        await AnalyticsService.adjust_event_type_counts(
+            db, {(event.event_type, event.group_id): 1}
+        )
 
-        logger.info(f"Created event locally: {event.id} (spond_id: {event.spond_id})")
+        logger.info("Created event locally: %s (spond_id: %s)", event.id, event.spond_id)
         return event
 
+    @staticmethod
+    async def create_many(
+        db: AsyncSession,
+        create_data_list: List[EventCreate],
+    ) -> List[Event]:
+        """
+        Create many local-only events in one INSERT
+
+        Meant for import flows: rows are written as ``local_only`` with a
+        single multi-row INSERT ... RETURNING instead of one add/flush per
+        event. ``sync_to_spond`` is ignored here — push the results with
+        ``push_many_to_spond`` afterwards. Single events that should go to
+        Spond straight away keep using ``create``.
+
+        Args:
+            db: Database session
+            create_data_list: Event creation data, one per event
+
+        Returns:
+            Created events, in input order
+        """
+        if not create_data_list:
+            return []
+
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+
+        rows = []
+        for create_data in create_data_list:
+            invite_time_iso = _compute_invite_send_at(
+                create_data.start_time.date(),
+                create_data.invite_lead_days,
+                create_data.invite_send_time,
+            )
+            resolved_invite_time: Optional[datetime] = None
+            if invite_time_iso:
+                resolved_invite_time = datetime.fromisoformat(
+                    invite_time_iso.replace("Z", "+00:00")
+                ).astimezone(timezone.utc).replace(tzinfo=None)
+
+            raw_data = None
+            if create_data.group_id:
+                raw_data = {"recipients": {"group": {"id": create_data.group_id}}}
+
+            rows.append({
+                "spond_id": f"local_{uuid.uuid4().hex[:12]}",
+                "heading": create_data.heading,
+                "description": create_data.description,
+                "event_type": create_data.event_type,
+                "start_time": create_data.start_time,
+                "end_time": create_data.end_time,
+                "created_time": now,
+                "invite_time": resolved_invite_time,
+                "location_address": create_data.location_address,
+                "location_latitude": create_data.location_latitude,
+                "location_longitude": create_data.location_longitude,
+                "max_accepted": create_data.max_accepted,
+                "cancelled": create_data.cancelled,
+                "hidden": create_data.hidden,
+                "group_id": create_data.group_id,
+                "invited_subgroup_uids": create_data.invited_subgroup_uids,
+                "invite_lead_days": create_data.invite_lead_days,
+                "invite_send_time": create_data.invite_send_time,
+                "sync_status": "local_only",
+                "sync_error": None,
+                "last_synced_at": now,
+                "created_at": now,
+                "updated_at": now,
+                "raw_data": raw_data,
+            })
+
+        # ORM-enabled bulk INSERT: one executemany with RETURNING (batched
+        # into multi-row VALUES by insertmanyvalues), loading the new rows
+        # straight into the identity map.
+        result = await db.scalars(
+            sa_insert(Event).returning(Event, sort_by_parameter_order=True),
+            rows,
+        )
+        events = list(result.all())
+        await AnalyticsService.adjust_event_type_counts(
+            db, Counter((event.event_type, event.group_id) for event in events)
+        )
+
+        logger.info("Created %d events locally", len(events))
+        return events
+
     @staticmethod
     async def push_to_spond(
         db: AsyncSession,
@@ -639,139 +894,248 @@ class EventService:
             raise ValueError(f"Event {event_id} not found")
 
         try:
-            # Prepare event data for Spond API with correct field names
-            # Timestamps must be ISO 8601 format with Z suffix for UTC
-            start_ts = event.start_time.isoformat()
-            if not start_ts.endswith("Z"):
-                start_ts += "Z"
-            end_ts = event.end_time.isoformat()
-            if not end_ts.endswith("Z"):
-                end_ts += "Z"
-
-            spond_data = {
-                "heading": event.heading,
-                "description": event.description or "",
-                "spondType": event.event_type,
-                "startTimestamp": start_ts,
-                "endTimestamp": end_ts,
-                "maxAccepted": event.max_accepted,
-            }
-
-            # Add location if provided
-            if event.location_address:
-                spond_data["location"] = {
-                    "address": event.location_address,
-                    "latitude": event.location_latitude,
-                    "longitude": event.location_longitude,
-                }
-
-            # Schedule the invitation if the user set the lead-days/send-time
-            # pair. Recompute on every push so a date change after creation
-            # still produces the right inviteTime.
-            invite_time_iso = _compute_invite_send_at(
-                event.start_time.date(),
-                event.invite_lead_days,
-                event.invite_send_time,
-            )
-            if invite_time_iso:
-                spond_data["inviteTime"] = invite_time_iso
-
-            # Extract group_id from raw_data if available
-            group_id = event.group_id
-            if not group_id and event.raw_data and isinstance(event.raw_data, dict):
-                recipients = event.raw_data.get("recipients", {})
-                if isinstance(recipients, dict):
-                    group = recipients.get("group", {})
-                    if isinstance(group, dict):
-                        group_id = group.get("id")
-
-            # Audience precedence:
-            #   1. event.invited_subgroup_uids → resolve to members of those
-            #      subgroups within the chosen group
-            #   2. raw_data.recipients.groupMembers (the realized roster from
-            #      a previous sync — preserves whatever was last invited)
-            #   3. None → Spond invites the whole group
-            invited_member_ids = None
-            if event.invited_subgroup_uids and group_id:
-                invited_member_ids = (
-                    await EventService._resolve_subgroup_member_ids(
-                        db, group_id, list(event.invited_subgroup_uids)
-                    )
-                )
-                if not invited_member_ids:
-                    logger.warning(
-                        "Subgroup uids %r resolved to zero members on push; "
-                        "falling back to whole group",
-                        event.invited_subgroup_uids,
-                    )
-                    invited_member_ids = None
-            if invited_member_ids is None and event.raw_data and isinstance(
-                event.raw_data, dict
-            ):
-                recipients = event.raw_data.get("recipients", {})
-                if isinstance(recipients, dict):
-                    group_members = recipients.get("groupMembers")
-                    if group_members:
-                        invited_member_ids = group_members
-
-            owner_ids = None
-            if event.raw_data and isinstance(event.raw_data, dict):
-                owners = event.raw_data.get("owners", [])
-                if owners:
-                    owner_ids = [o.get("id") for o in owners if o.get("id")]
-
-            # Create or update in Spond
-            is_local = event.sync_status == "local_only" or (
-                event.spond_id and event.spond_id.startswith("local_")
-            )
-            if is_local:
-                # Create new event in Spond
-                if not group_id:
-                    raise ValueError(
-                        "Cannot push event to Spond without a group. "
-                        "Please select a group when creating the event."
-                    )
-                result = await spond_service.create_event(
-                    spond_data,
-                    group_id=group_id,
-                    invited_member_ids=invited_member_ids,
-                    owner_ids=owner_ids
-                )
-                new_spond_id = result.get("id") if result else None
-                if not new_spond_id:
-                    raise ValueError("Spond API did not return an event ID")
-                event.spond_id = new_spond_id
-                logger.info(f"Created event in Spond: {event.spond_id}")
-            else:
-                # Update existing event in Spond
-                await spond_service.update_event(event.spond_id, spond_data)
-                logger.info(f"Updated event in Spond: {event.spond_id}")
-
-            # Persist the freshly-computed invite_time locally so the row
-            # reflects what we sent to Spond.
-            if invite_time_iso:
-                event.invite_time = datetime.fromisoformat(
-                    invite_time_iso.replace("Z", "+00:00")
-                ).astimezone(timezone.utc).replace(tzinfo=None)
-
-            # Update sync status
-            event.sync_status = "synced"
-            event.sync_error = None
-            event.last_synced_at = datetime.utcnow()
+            push = await EventService._prepare_spond_push(db, event)
+            new_spond_id = await EventService._send_spond_push(spond_service, event, push)
+            EventService._mark_pushed(event, push, new_spond_id)
 
             await db.flush()
-            await db.refresh(event)
 
             return event
 
         except Exception as e:
-            logger.error(f"Failed to push event to Spond: {e}")
+            logger.error("Failed to push event to Spond: %s", e)
             event.sync_status = "error"
             event.sync_error = str(e)
             await db.flush()
-            await db.refresh(event)
             raise
 
+    @staticmethod
+    async def push_many_to_spond(
+        db: AsyncSession,
+        event_ids: List[int],
+        spond_service: SpondService,
+        concurrency: int = 8,
+    ) -> List[Event]:
+        """
+        Push several local or pending events to Spond concurrently
+
+        Payloads are built first (they may read subgroup audiences from the
+        database), then the Spond calls run up to `concurrency` at a time
+        with no transaction open. A failure marks only that event as errored.
+
+        Args:
+            db: Database session
+            event_ids: Event IDs
+            spond_service: Spond service instance
+            concurrency: Maximum number of Spond calls in flight
+
+        Returns:
+            The events found, with updated sync status
+        """
+        result = await db.execute(select(Event).where(Event.id.in_(event_ids)))
+        events = list(result.scalars().all())
+
+        prepared = []
+        for event in events:
+            try:
+                prepared.append((event, await EventService._prepare_spond_push(db, event)))
+            except Exception as e:
+                logger.error("Failed to push event %s to Spond: %s", event.id, e)
+                event.sync_status = "error"
+                event.sync_error = str(e)
+
+        # Release the connection for the duration of the Spond calls
+        await db.commit()
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _send(event: Event, push: dict) -> Optional[str]:
+            async with semaphore:
+                return await EventService._send_spond_push(spond_service, event, push)
+
+        results = await asyncio.gather(
+            *(_send(event, push) for event, push in prepared), return_exceptions=True
+        )
+        for (event, push), result in zip(prepared, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to push event %s to Spond: %s", event.id, result)
+                event.sync_status = "error"
+                event.sync_error = str(result)
+            else:
+                EventService._mark_pushed(event, push, result)
+
+        await db.flush()
+        await EventService._attach_linked_shift_ids(db, events)
+
+        return events
+
+    @staticmethod
+    async def _prepare_spond_push(db: AsyncSession, event: Event) -> dict:
+        """
+        Build the Spond payload and audience for pushing an event
+
+        Args:
+            db: Database session
+            event: Event to push
+
+        Returns:
+            Dictionary with spond_data, group_id, invited_member_ids,
+            owner_ids, invite_time_iso and is_local
+
+        Raises:
+            ValueError: If a local event has no group to create it in
+        """
+        # Prepare event data for Spond API with correct field names
+        # Timestamps must be ISO 8601 format with Z suffix for UTC
+        start_ts = event.start_time.isoformat()
+        if not start_ts.endswith("Z"):
+            start_ts += "Z"
+        end_ts = event.end_time.isoformat()
+        if not end_ts.endswith("Z"):
+            end_ts += "Z"
+
+        spond_data = {
+            "heading": event.heading,
+            "description": event.description or "",
+            "spondType": event.event_type,
+            "startTimestamp": start_ts,
+            "endTimestamp": end_ts,
+            "maxAccepted": event.max_accepted,
+        }
+
+        # Add location if provided
+        if event.location_address:
+            spond_data["location"] = {
+                "address": event.location_address,
+                "latitude": event.location_latitude,
+                "longitude": event.location_longitude,
+            }
+
+        # Schedule the invitation if the user set the lead-days/send-time
+        # pair. Recompute on every push so a date change after creation
+        # still produces the right inviteTime.
+        invite_time_iso = _compute_invite_send_at(
+            event.start_time.date(),
+            event.invite_lead_days,
+            event.invite_send_time,
+        )
+        if invite_time_iso:
+            spond_data["inviteTime"] = invite_time_iso
+
+        # Extract group_id from raw_data if available
+        group_id = event.group_id
+        if not group_id and event.raw_data and isinstance(event.raw_data, dict):
+            recipients = event.raw_data.get("recipients", {})
+            if isinstance(recipients, dict):
+                group = recipients.get("group", {})
+                if isinstance(group, dict):
+                    group_id = group.get("id")
+
+        # Audience precedence:
+        #   1. event.invited_subgroup_uids → resolve to members of those
+        #      subgroups within the chosen group
+        #   2. raw_data.recipients.groupMembers (the realized roster from
+        #      a previous sync — preserves whatever was last invited)
+        #   3. None → Spond invites the whole group
+        invited_member_ids = None
+        if event.invited_subgroup_uids and group_id:
+            invited_member_ids = (
+                await EventService._resolve_subgroup_member_ids(
+                    db, group_id, list(event.invited_subgroup_uids)
+                )
+            )
+            if not invited_member_ids:
+                logger.warning(
+                    "Subgroup uids %r resolved to zero members on push; "
+                    "falling back to whole group",
+                    event.invited_subgroup_uids,
+                )
+                invited_member_ids = None
+        if invited_member_ids is None and event.raw_data and isinstance(
+            event.raw_data, dict
+        ):
+            recipients = event.raw_data.get("recipients", {})
+            if isinstance(recipients, dict):
+                group_members = recipients.get("groupMembers")
+                if group_members:
+                    invited_member_ids = group_members
+
+        owner_ids = None
+        if event.raw_data and isinstance(event.raw_data, dict):
+            owners = event.raw_data.get("owners", [])
+            if owners:
+                owner_ids = [o.get("id") for o in owners if o.get("id")]
+
+        is_local = event.sync_status == "local_only" or (
+            event.spond_id and event.spond_id.startswith("local_")
+        )
+        if is_local and not group_id:
+            raise ValueError(
+                "Cannot push event to Spond without a group. "
+                "Please select a group when creating the event."
+            )
+
+        return {
+            "spond_data": spond_data,
+            "group_id": group_id,
+            "invited_member_ids": invited_member_ids,
+            "owner_ids": owner_ids,
+            "invite_time_iso": invite_time_iso,
+            "is_local": is_local,
+        }
+
+    @staticmethod
+    async def _send_spond_push(
+        spond_service: SpondService, event: Event, push: dict
+    ) -> Optional[str]:
+        """
+        Create or update the event in Spond (network only, no DB access)
+
+        Args:
+            spond_service: Spond service instance
+            event: Event being pushed
+            push: Result of _prepare_spond_push
+
+        Returns:
+            The new Spond ID for a created event, None for an update
+        """
+        if push["is_local"]:
+            # Create new event in Spond
+            result = await spond_service.create_event(
+                push["spond_data"],
+                group_id=push["group_id"],
+                invited_member_ids=push["invited_member_ids"],
+                owner_ids=push["owner_ids"]
+            )
+            new_spond_id = result.get("id") if result else None
+            if not new_spond_id:
+                raise ValueError("Spond API did not return an event ID")
+            logger.info("Created event in Spond: %s", new_spond_id)
+            return new_spond_id
+
+        # Update existing event in Spond
+        await spond_service.update_event(event.spond_id, push["spond_data"])
+        logger.info("Updated event in Spond: %s", event.spond_id)
+        return None
+
+    @staticmethod
+    def _mark_pushed(event: Event, push: dict, new_spond_id: Optional[str]) -> None:
+        """Record a successful push on the local event."""
+        if new_spond_id:
+            event.spond_id = new_spond_id
+
+        # Persist the freshly-computed invite_time locally so the row
+        # reflects what we sent to Spond.
+        if push["invite_time_iso"]:
+            event.invite_time = datetime.fromisoformat(
+                push["invite_time_iso"].replace("Z", "+00:00")
+            ).astimezone(timezone.utc).replace(tzinfo=None)
+
+        # Update sync status
+        event.sync_status = "synced"
+        event.sync_error = None
+        event.last_synced_at = datetime.now(timezone.utc).replace(tzinfo=None)
+
     @staticmethod
     async def get_statistics(
         db: AsyncSession,
@@ -787,47 +1151,37 @@ class EventService:
         Returns:
             Dictionary with statistics
         """
-        # Naive UTC to match the TIMESTAMP WITHOUT TIME ZONE columns and the
-        # rest of this module (every other now() here uses utcnow()). Mixing an
-        # aware datetime with the naive end_time filter from
-        # _build_filter_conditions makes asyncpg reject the whole query.
-        now = datetime.utcnow()
+        # Database-side naive-UTC now (the columns hold naive UTC): no
+        # per-request datetime parameter, so the statement (and its asyncpg
+        # prepared-statement cache entry) is identical every call.
+        now = utcnow()
 
         # Base query conditions
         conditions = []
         if filters:
             conditions = EventService._build_filter_conditions(filters)
 
-        # Total events
-        total_query = select(func.count(Event.id))
-        if conditions:
-            total_query = total_query.where(and_(*conditions))
-        total_result = await db.execute(total_query)
-        total_events = total_result.scalar()
-
-        # Upcoming events
-        upcoming_query = select(func.count(Event.id)).where(Event.start_time >= now)
-        if conditions:
-            upcoming_query = upcoming_query.where(and_(*conditions))
-        upcoming_result = await db.execute(upcoming_query)
-        upcoming_events = upcoming_result.scalar()
-
-        # Past events
-        past_events = total_events - upcoming_events
-
-        # Cancelled events
-        cancelled_query = select(func.count(Event.id)).where(Event.cancelled.is_(True))
+        # One aggregate pass, grouped by type: per-type totals plus
+        # conditional upcoming/past/cancelled counts, summed up below.
+        stats_query = select(
+            Event.event_type,
+            func.count(Event.id).label("total"),
+            func.sum(case((Event.start_time >= now, 1), else_=0)).label("upcoming"),
+            func.sum(case((Event.start_time < now, 1), else_=0)).label("past"),
+            func.sum(case((Event.cancelled.is_(True), 1), else_=0)).label("cancelled"),
+        ).group_by(Event.event_type)
         if conditions:
-            cancelled_query = cancelled_query.where(and_(*conditions))
-        cancelled_result = await db.execute(cancelled_query)
-        cancelled_events = cancelled_result.scalar()
-
-        # Events by type
-        type_query = select(Event.event_type, func.count(Event.id)).group_by(Event.event_type)
-        if conditions:
-            type_query = type_query.where(and_(*conditions))
-        type_result = await db.execute(type_query)
-        events_by_type = {row[0]: row[1] for row in type_result.all()}
+            stats_query = stats_query.where(and_(*conditions))
+        # Single pass over plain tuples builds the per-type map and the totals
+        total_events = upcoming_events = past_events = cancelled_events = 0
+        events_by_type = {}
+        result = await db.execute(stats_query)
+        for event_type, total, upcoming, past, cancelled in result.tuples():
+            events_by_type[event_type] = total
+            total_events += total
+            upcoming_events += upcoming or 0
+            past_events += past or 0
+            cancelled_events += cancelled or 0
 
         return {
             "total_events": total_events,
@@ -879,12 +1233,14 @@ class EventService:
             query = query.where(~Event.category_id.in_(exclude_category_ids))
 
         query = query.order_by(Event.start_time.desc())
-        result = await db.execute(query)
-        events = result.scalars().all()
+
+        # Stream in batches: report ranges can span every event, and only
+        # the small per-event dicts below need to outlive each batch.
+        events = await db.stream_scalars(query.execution_options(yield_per=500))
 
         # Build response with attendance stats
         events_data = []
-        for event in events:
+        async for event in events:
             # Extract responses array (supports both old and new formats)
             responses = []
             if event.responses:
@@ -941,9 +1297,12 @@ class EventService:
         db: AsyncSession,
         event_id: int,
         spond_service: SpondService
-    ) -> bytes:
+    ) -> Tuple[Event, AsyncIterator[bytes]]:
         """
-        Get attendance export for an event as Excel file
+        Get attendance export for an event as a streamed Excel file
+
+        The first chunk is fetched before returning so that Spond errors
+        surface here rather than after the response headers have been sent.
 
         Args:
             db: Database session
@@ -951,19 +1310,35 @@ class EventService:
             spond_service: Spond service instance
 
         Returns:
-            Excel file bytes
+            Tuple of (event, async iterator of Excel file byte chunks)
 
         Raises:
             ValueError: If event not found
         """
-        event = await EventService.get_by_id(db, event_id)
+        # Only the columns the export and its filename need — skips the
+        # description/raw JSON blobs and the linked-shift lookup.
+        event = await db.scalar(
+            select(Event)
+            .options(load_only(Event.spond_id, Event.heading, Event.start_time))
+            .where(Event.id == event_id)
+        )
         if not event:
             raise ValueError(f"Event {event_id} not found")
 
-        # Get attendance from Spond API
-        xlsx_data = await spond_service.get_event_attendance_xlsx(event.spond_id)
+        # Stream attendance from Spond API
+        chunks = spond_service.stream_event_attendance_xlsx(event.spond_id)
+        first_chunk = await anext(chunks, b"")
 
-        return xlsx_data
+        async def _body() -> AsyncIterator[bytes]:
+            try:
+                if first_chunk:
+                    yield first_chunk
+                async for chunk in chunks:
+                    yield chunk
+            finally:
+                await chunks.aclose()
+
+        return event, _body()
 
     @staticmethod
     async def update_response(
@@ -999,15 +1374,49 @@ class EventService:
             )
 
             logger.info(
-                f"Updated response for user {user_id} on event {event.spond_id} "
-                f"to {response_type}"
+                "Updated response for user %s on event %s to %s",
+                user_id,
+                event.spond_id,
+                response_type,
             )
 
             # Note: The response in the database will be updated on next sync
             # For immediate update, we could fetch the event again from Spond
 
         except Exception as e:
-            logger.error(f"Failed to update response in Spond API: {e}")
+            logger.error("Failed to update response in Spond API: %s", e)
             raise
 
         return event
+
+    @staticmethod
+    async def update_responses(
+        db: AsyncSession,
+        event_id: int,
+        user_ids: List[str],
+        response_type: str,
+        spond_service: SpondService
+    ) -> Optional[List[str]]:
+        """
+        Set the same response for several users on an event
+
+        Args:
+            db: Database session
+            event_id: Event ID
+            user_ids: User IDs
+            response_type: Response type (accepted, declined, etc.)
+            spond_service: Spond service instance
+
+        Returns:
+            User IDs that failed to update, or None if the event was not found
+        """
+        spond_id = await db.scalar(select(Event.spond_id).where(Event.id == event_id))
+        if spond_id is None:
+            return None
+
+        # Note: as with update_response, the database picks these up on next sync
+        return await spond_service.batch_change_event_responses(
+            spond_id,
+            user_ids,
+            response_type
+        )
@@ -2,22 +2,75 @@
 Event synchronization service
 Handles syncing events from Spond API to local database
 """
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Set
+from collections import Counter
 from datetime import datetime, timedelta, timezone
+import asyncio
+import functools
 import logging
 
-from sqlalchemy import select
+from sqlalchemy import select, case, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.db.upsert import dialect_insert, keep_if_unchanged, payload_hash
 from app.models.event import Event
 from app.models.sync_history import SyncHistory
 from app.services.spond_service import SpondService
+from app.services.analytics_service import AnalyticsService
 from app.services.category_service import CategoryService
 from app.services.training_reverse_sync_service import TrainingReverseSyncService
 
 logger = logging.getLogger(__name__)
 
+# Columns a sync overwrites outright on an existing event
+_SPOND_OWNED_FIELDS = (
+    "heading",
+    "description",
+    "event_type",
+    "start_time",
+    "end_time",
+    "created_time",
+    "invite_time",
+    "cancelled",
+    "hidden",
+    "location_address",
+    "location_latitude",
+    "location_longitude",
+    "max_accepted",
+    "group_id",
+    "responses",
+    "raw_data",
+)
+
+# Spond response id arrays and the answer each one maps to
+_RESPONSE_ID_KEYS = (
+    ("acceptedIds", "accepted"),
+    ("declinedIds", "declined"),
+    ("unansweredIds", "unanswered"),
+    ("waitinglistIds", "waitinglist"),
+    ("unconfirmedIds", "unconfirmed"),
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso_naive_utc(timestamp_str: str) -> datetime:
+    """
+    Parse an ISO timestamp to naive UTC (the events columns are TIMESTAMP
+    WITHOUT TIME ZONE). Memoized: Spond repeats the same timestamps across
+    a group's events. Raises ValueError on bad input, which lru_cache does
+    not cache.
+
+    The trailing 'Z' is rewritten for Python 3.10, whose fromisoformat
+    does not accept it (3.11+ does).
+    """
+    if timestamp_str.endswith("Z"):
+        timestamp_str = timestamp_str[:-1] + "+00:00"
+    dt = datetime.fromisoformat(timestamp_str)
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
 
 class EventSyncService:
     """
@@ -49,71 +102,95 @@ class EventSyncService:
             status="running",
             started_at=datetime.utcnow(),
         )
-        db.add(sync_record)
-        await db.flush()
+        # Added to the session only once the outcome is known, so the record
+        # costs one INSERT instead of INSERT + UPDATE. Nothing reads its id
+        # before then, and it is not visible to others until commit anyway.
 
         stats = {
             "fetched": 0,
             "created": 0,
             "updated": 0,
             "errors": 0,
+            "skipped": 0,
             "shifts_updated": 0,
         }
 
         try:
-            # Fetch group data to get member profiles for enriching responses
-            member_lookup: Dict[str, Dict[str, Any]] = {}
-            if group_id:
-                try:
-                    logger.info(f"Fetching group data for member profiles (group_id={group_id})")
-                    group_data = await spond_service.get_group(group_id)
-                    if group_data and "members" in group_data:
-                        for member in group_data["members"]:
-                            member_id = member.get("id")
-                            if member_id:
-                                # Build profile data from member info
-                                profile = member.get("profile", {})
-                                member_lookup[member_id] = {
-                                    "id": member_id,
-                                    "profile": {
-                                        "id": profile.get("id"),
-                                        "firstName": member.get("firstName") or profile.get("firstName"),
-                                        "lastName": member.get("lastName") or profile.get("lastName"),
-                                        "email": member.get("email") or profile.get("email"),
-                                    },
-                                    "firstName": member.get("firstName"),
-                                    "lastName": member.get("lastName"),
-                                    "email": member.get("email"),
-                                }
-                        logger.info(f"Built member lookup with {len(member_lookup)} members")
-                except Exception as e:
-                    logger.warning(f"Failed to fetch group data for member profiles: {e}")
-
-            # Fetch events from Spond API (include past events by setting min_end far back)
+            # Fetch events from Spond API (include past events by setting
+            # min_end far back), overlapped with the group fetch that provides
+            # member profiles for enriching responses
             logger.info(f"Fetching events from Spond API (group_id={group_id})")
             min_end = datetime.utcnow() - timedelta(days=365 * 5)  # Go back 5 years
-            events_data = await spond_service.get_events(
-                group_id=group_id,
-                max_events=max_events,
-                min_end=min_end,
-                include_hidden=bool(group_id),
+            member_lookup, events_data = await asyncio.gather(
+                EventSyncService._fetch_member_lookup(spond_service, group_id),
+                spond_service.get_events(
+                    group_id=group_id,
+                    max_events=max_events,
+                    min_end=min_end,
+                    include_hidden=bool(group_id),
+                ),
             )
 
             stats["fetched"] = len(events_data)
             logger.info(f"Fetched {len(events_data)} events from Spond")
 
-            # Process each event
-            synced_spond_ids: list[str] = []
+            # Build one row per event, last occurrence winning on a repeated
+            # spond_id (a single upsert can't touch the same row twice), all
+            # with the same last_synced_at for the batch
+            sync_now = datetime.utcnow()
+            rows_by_id: Dict[str, Dict[str, Any]] = {}
             for event_dict in events_data:
                 try:
-                    await EventSyncService._sync_single_event(db, event_dict, stats, member_lookup)
-                    sid = event_dict.get("id")
-                    if sid:
-                        synced_spond_ids.append(sid)
+                    row = EventSyncService._build_event_row(
+                        event_dict, sync_now, member_lookup
+                    )
+                    if row is not None:
+                        rows_by_id[row["spond_id"]] = row
                 except Exception as e:
                     logger.error(f"Error syncing event {event_dict.get('id')}: {e}")
                     stats["errors"] += 1
 
+            synced_spond_ids: list[str] = list(rows_by_id)
+            if rows_by_id:
+                # Current type/group of the rows about to be overwritten, for
+                # the event_type_counts deltas below
+                existing_keys = {
+                    spond_id: (event_type, event_group_id)
+                    for spond_id, event_type, event_group_id in await db.execute(
+                        select(Event.spond_id, Event.event_type, Event.group_id)
+                        .where(Event.spond_id.in_(synced_spond_ids))
+                    )
+                }
+                existing_ids = set(existing_keys)
+
+                # Auto-categorize; headings repeat a lot across a group's
+                # events, so match each distinct heading once
+                category_by_heading: Dict[str, Optional[int]] = {}
+                for row in rows_by_id.values():
+                    heading = row["heading"]
+                    if heading not in category_by_heading:
+                        category_by_heading[heading] = (
+                            await CategoryService.match_event_to_category(db, heading)
+                        )
+                    row["category_id"] = category_by_heading[heading]
+
+                written_ids = await EventSyncService._upsert_events(
+                    db, list(rows_by_id.values())
+                )
+
+                # Moves between (event_type, group_id) buckets; rows whose
+                # type and group did not change net out to zero
+                type_count_deltas: Counter = Counter()
+                for spond_id, row in rows_by_id.items():
+                    type_count_deltas[(row["event_type"], row["group_id"])] += 1
+                    if spond_id in existing_keys:
+                        type_count_deltas[existing_keys[spond_id]] -= 1
+                await AnalyticsService.adjust_event_type_counts(db, type_count_deltas)
+
+                stats["created"] = len(rows_by_id) - len(existing_ids)
+                stats["updated"] = len(written_ids & existing_ids)
+                stats["skipped"] = len(existing_ids) - stats["updated"]
+
             # Reverse-sync: propagate Spond-side edits (time, cancellation,
             # leader, audience) back onto any linked training shifts. Read into
             # local only — never re-publishes, so no feedback loop.
@@ -139,12 +216,17 @@ class EventSyncService:
             sync_record.items_fetched = stats["fetched"]
             sync_record.items_created = stats["created"]
             sync_record.items_updated = stats["updated"]
+            db.add(sync_record)
 
             await db.flush()
 
+            # Fresh events invalidate the cached dashboard summaries
+            AnalyticsService.invalidate_summary_cache()
+
             logger.info(
                 f"Event sync completed: {stats['created']} created, "
-                f"{stats['updated']} updated, {stats['errors']} errors"
+                f"{stats['updated']} updated, {stats['skipped']} unchanged, "
+                f"{stats['errors']} errors"
             )
 
             return stats
@@ -157,145 +239,197 @@ class EventSyncService:
             sync_record.success = False
             sync_record.completed_at = datetime.utcnow()
             sync_record.error_message = str(e)
+            db.add(sync_record)
             await db.flush()
 
             raise
 
     @staticmethod
-    async def _sync_single_event(
-        db: AsyncSession,
+    async def _fetch_member_lookup(
+        spond_service: SpondService,
+        group_id: Optional[str],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch a group's members for response enrichment
+
+        Never raises: without a group, or if the fetch fails, responses are
+        simply not enriched.
+
+        Args:
+            spond_service: Spond service instance
+            group_id: Optional group ID
+
+        Returns:
+            Dictionary mapping member IDs to response fields (may be empty)
+        """
+        if not group_id:
+            return {}
+        try:
+            logger.info(f"Fetching group data for member profiles (group_id={group_id})")
+            group_data = await spond_service.get_group(group_id)
+            if group_data and "members" in group_data:
+                member_lookup = EventSyncService._build_member_lookup(group_data["members"])
+                logger.info(f"Built member lookup with {len(member_lookup)} members")
+                return member_lookup
+        except Exception as e:
+            logger.warning(f"Failed to fetch group data for member profiles: {e}")
+        return {}
+
+    @staticmethod
+    def _build_member_lookup(members: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Index a group's members by ID for response enrichment
+
+        Args:
+            members: Member dicts from the Spond group payload
+
+        Returns:
+            Dictionary mapping member IDs to the profile/firstName/lastName/
+            email part of a response entry, built once per member and
+            splatted into every entry for that member
+        """
+        member_lookup: Dict[str, Dict[str, Any]] = {}
+        for member in members:
+            member_id = member.get("id")
+            if not member_id:
+                continue
+            # Read each field once; the nested profile is only a fallback
+            profile = member.get("profile") or {}
+            first_name = member.get("firstName")
+            last_name = member.get("lastName")
+            email = member.get("email")
+            member_lookup[member_id] = {
+                "profile": {
+                    "id": profile.get("id"),
+                    "firstName": first_name or profile.get("firstName"),
+                    "lastName": last_name or profile.get("lastName"),
+                    "email": email or profile.get("email"),
+                },
+                "firstName": first_name,
+                "lastName": last_name,
+                "email": email,
+            }
+        return member_lookup
+
+    @staticmethod
+    def _build_event_row(
         event_dict: Dict[str, Any],
-        stats: Dict[str, int],
+        sync_now: datetime,
         member_lookup: Optional[Dict[str, Dict[str, Any]]] = None
-    ) -> None:
+    ) -> Optional[Dict[str, Any]]:
         """
-        Sync a single event to the database
+        Map a Spond event onto ``events`` column values
 
         Args:
-            db: Database session
             event_dict: Event data from Spond API
-            stats: Statistics dictionary to update
+            sync_now: Timestamp of this sync run (naive UTC)
             member_lookup: Optional dictionary mapping member IDs to profile data
+
+        Returns:
+            Column values for the upsert, or None if the event has no ID
         """
         spond_id = event_dict.get("id")
         if not spond_id:
             logger.warning("Event missing ID, skipping")
-            return
-
-        # Check if event already exists
-        result = await db.execute(
-            select(Event).where(Event.spond_id == spond_id)
-        )
-        existing_event = result.scalar_one_or_none()
-
-        # Extract event data
-        heading = event_dict.get("heading", "Untitled Event")
-        description = event_dict.get("description")
-        event_type = event_dict.get("type", "EVENT")
-
-        # Parse timestamps
-        start_time = EventSyncService._parse_timestamp(event_dict.get("startTimestamp"))
-        end_time = EventSyncService._parse_timestamp(event_dict.get("endTimestamp"))
-        created_time = EventSyncService._parse_timestamp(event_dict.get("createdTime"))
-        invite_time = EventSyncService._parse_timestamp(event_dict.get("inviteTime"))
-
-        # Extract status flags
-        cancelled = event_dict.get("cancelled", False)
-        hidden = event_dict.get("hidden", False)
+            return None
 
         # Extract location
         location = event_dict.get("location", {})
-        location_address = location.get("address") if location else None
-        location_latitude = location.get("latitude") if location else None
-        location_longitude = location.get("longitude") if location else None
-
-        # Extract max participants
-        max_accepted = event_dict.get("maxAccepted", 0)
 
         # Extract group_id from recipients
         recipients = event_dict.get("recipients", {})
         group_data = recipients.get("group", {}) if recipients else {}
-        group_id = group_data.get("id") if group_data else None
-
-        # Extract responses and enrich with member profile data
-        responses = EventSyncService._extract_responses(event_dict.get("responses"), member_lookup)
-
-        # Auto-categorize event if not manually overridden
-        category_id = None
-        if existing_event and not existing_event.category_override:
-            # Re-categorize existing event if not manually set
-            category_id = await CategoryService.match_event_to_category(db, heading)
-        elif not existing_event:
-            # Auto-categorize new event
-            category_id = await CategoryService.match_event_to_category(db, heading)
-
-        if existing_event:
-            # Update existing event
-            now = datetime.utcnow()
-            existing_event.heading = heading
-            existing_event.description = description
-            existing_event.event_type = event_type
-            existing_event.start_time = start_time
-            existing_event.end_time = end_time
-            existing_event.created_time = created_time
-            existing_event.invite_time = invite_time
-            existing_event.cancelled = cancelled
-            existing_event.hidden = hidden
-            existing_event.location_address = location_address
-            existing_event.location_latitude = location_latitude
-            existing_event.location_longitude = location_longitude
-            existing_event.max_accepted = max_accepted
-            existing_event.group_id = group_id
-            existing_event.responses = responses
-            existing_event.raw_data = event_dict
-            existing_event.last_synced_at = now
-            existing_event.updated_at = now
-            # Update category if auto-categorized
-            if category_id is not None and not existing_event.category_override:
-                existing_event.category_id = category_id
-            # Only update sync_status to 'synced' if it's not local_only
-            if existing_event.sync_status != "local_only":
-                existing_event.sync_status = "synced"
-                existing_event.sync_error = None
-
-            stats["updated"] += 1
-            logger.debug(f"Updated event {spond_id}: {heading}")
-
-        else:
-            # Create new event
-            now = datetime.utcnow()
-            new_event = Event(
-                spond_id=spond_id,
-                heading=heading,
-                description=description,
-                event_type=event_type,
-                start_time=start_time,
-                end_time=end_time,
-                created_time=created_time,
-                invite_time=invite_time,
-                cancelled=cancelled,
-                hidden=hidden,
-                location_address=location_address,
-                location_latitude=location_latitude,
-                location_longitude=location_longitude,
-                max_accepted=max_accepted,
-                group_id=group_id,
-                category_id=category_id,  # Auto-categorize new event
-                category_override=False,  # Not manually set
-                responses=responses,
-                raw_data=event_dict,
-                sync_status="synced",  # Events from Spond are synced by definition
-                sync_error=None,
-                last_synced_at=now,
-                created_at=now,
-                updated_at=now,
-            )
 
-            db.add(new_event)
-            stats["created"] += 1
-            logger.debug(f"Created event {spond_id}: {heading}")
+        # Responses enriched with member profile data
+        responses = EventSyncService._extract_responses(
+            event_dict.get("responses"), member_lookup
+        )
+
+        return {
+            "spond_id": spond_id,
+            "heading": event_dict.get("heading", "Untitled Event"),
+            "description": event_dict.get("description"),
+            "event_type": event_dict.get("type", "EVENT"),
+            "start_time": EventSyncService._parse_timestamp(event_dict.get("startTimestamp")),
+            "end_time": EventSyncService._parse_timestamp(event_dict.get("endTimestamp")),
+            "created_time": EventSyncService._parse_timestamp(event_dict.get("createdTime")),
+            "invite_time": EventSyncService._parse_timestamp(event_dict.get("inviteTime")),
+            "cancelled": event_dict.get("cancelled", False),
+            "hidden": event_dict.get("hidden", False),
+            "location_address": location.get("address") if location else None,
+            "location_latitude": location.get("latitude") if location else None,
+            "location_longitude": location.get("longitude") if location else None,
+            "max_accepted": event_dict.get("maxAccepted", 0),
+            "group_id": group_data.get("id") if group_data else None,
+            "category_id": None,
+            "category_override": False,
+            "responses": responses,
+            "raw_data": event_dict,
+            "content_hash": payload_hash(event_dict, responses),
+            "sync_status": "synced",  # Events from Spond are synced by definition
+            "sync_error": None,
+            "last_synced_at": sync_now,
+            "created_at": sync_now,
+            "updated_at": sync_now,
+        }
+
+    @staticmethod
+    async def _upsert_events(db: AsyncSession, rows: List[Dict[str, Any]]) -> Set[str]:
+        """
+        Insert new events and refresh existing ones in one statement
+
+        ``INSERT ... ON CONFLICT (spond_id) DO UPDATE``, executed once with
+        all rows as parameters. On conflict every Spond-owned column is
+        overwritten, while local state is kept: a manual category
+        (``category_override``) and the ``local_only`` sync status.
+
+        Every row gets last_synced_at bumped. Existing rows whose Spond
+        content (``content_hash``) is unchanged keep their stored content
+        columns, as in the group/member upserts; updated_at only moves when
+        the content, category or sync status actually changes.
 
-        await db.flush()
+        Args:
+            db: Database session
+            rows: Rows from ``_build_event_row``, unique by spond_id
+
+        Returns:
+            spond_ids of the rows actually inserted or updated
+        """
+        stmt = dialect_insert(db)(Event.__table__)
+        excluded = stmt.excluded
+        keep_local = Event.sync_status == "local_only"
+        new_category_id = case(
+            (Event.category_override.is_(True), Event.category_id),
+            (excluded.category_id.is_(None), Event.category_id),
+            else_=excluded.category_id,
+        )
+        changed = or_(
+            Event.content_hash.is_distinct_from(excluded.content_hash),
+            Event.category_id.is_distinct_from(new_category_id),
+            # pending/error rows still get reset to synced
+            Event.sync_status.not_in(("synced", "local_only")),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Event.spond_id],
+            set_={
+                **keep_if_unchanged(Event, excluded, _SPOND_OWNED_FIELDS),
+                "content_hash": excluded.content_hash,
+                "category_id": new_category_id,
+                "sync_status": case((keep_local, Event.sync_status), else_="synced"),
+                "sync_error": case((keep_local, Event.sync_error), else_=None),
+                "last_synced_at": excluded.last_synced_at,
+                "updated_at": case((changed, excluded.updated_at), else_=Event.updated_at),
+            },
+        ).returning(Event.spond_id, Event.updated_at)
+        result = await db.execute(stmt, rows)
+
+        # Inserted and changed rows carry this run's updated_at
+        updated_at_by_id = {row["spond_id"]: row["updated_at"] for row in rows}
+        return {
+            spond_id
+            for spond_id, updated_at in result.tuples()
+            if updated_at == updated_at_by_id[spond_id]
+        }
 
     @staticmethod
     def _parse_timestamp(timestamp_str: Optional[str]) -> Optional[datetime]:
@@ -312,16 +446,8 @@ class EventSyncService:
             return None
 
         try:
-            # Handle ISO format with timezone
-            if timestamp_str.endswith('Z'):
-                timestamp_str = timestamp_str[:-1] + '+00:00'
-
-            dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-            # Events table is TIMESTAMP WITHOUT TIME ZONE — normalize to naive UTC
-            if dt.tzinfo is not None:
-                dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
-            return dt
-        except (ValueError, AttributeError) as e:
+            return _parse_iso_naive_utc(timestamp_str)
+        except (ValueError, TypeError, AttributeError) as e:
             logger.warning(f"Failed to parse timestamp '{timestamp_str}': {e}")
             return None
 
@@ -352,72 +478,13 @@ class EventSyncService:
 
         # Build detailed responses array if we have member lookup data
         if member_lookup:
-            detailed_responses = []
-
-            # Process accepted members
-            for member_id in responses_dict.get("acceptedIds", []):
-                member_data = member_lookup.get(member_id)
-                if member_data:
-                    detailed_responses.append({
-                        "id": member_id,
-                        "answer": "accepted",
-                        "profile": member_data.get("profile", {}),
-                        "firstName": member_data.get("firstName"),
-                        "lastName": member_data.get("lastName"),
-                        "email": member_data.get("email"),
-                    })
-
-            # Process declined members
-            for member_id in responses_dict.get("declinedIds", []):
-                member_data = member_lookup.get(member_id)
-                if member_data:
-                    detailed_responses.append({
-                        "id": member_id,
-                        "answer": "declined",
-                        "profile": member_data.get("profile", {}),
-                        "firstName": member_data.get("firstName"),
-                        "lastName": member_data.get("lastName"),
-                        "email": member_data.get("email"),
-                    })
-
-            # Process unanswered members
-            for member_id in responses_dict.get("unansweredIds", []):
-                member_data = member_lookup.get(member_id)
-                if member_data:
-                    detailed_responses.append({
-                        "id": member_id,
-                        "answer": "unanswered",
-                        "profile": member_data.get("profile", {}),
-                        "firstName": member_data.get("firstName"),
-                        "lastName": member_data.get("lastName"),
-                        "email": member_data.get("email"),
-                    })
-
-            # Process waitinglist members
-            for member_id in responses_dict.get("waitinglistIds", []):
-                member_data = member_lookup.get(member_id)
-                if member_data:
-                    detailed_responses.append({
-                        "id": member_id,
-                        "answer": "waitinglist",
-                        "profile": member_data.get("profile", {}),
-                        "firstName": member_data.get("firstName"),
-                        "lastName": member_data.get("lastName"),
-                        "email": member_data.get("email"),
-                    })
-
-            # Process unconfirmed members
-            for member_id in responses_dict.get("unconfirmedIds", []):
-                member_data = member_lookup.get(member_id)
-                if member_data:
-                    detailed_responses.append({
-                        "id": member_id,
-                        "answer": "unconfirmed",
-                        "profile": member_data.get("profile", {}),
-                        "firstName": member_data.get("firstName"),
-                        "lastName": member_data.get("lastName"),
-                        "email": member_data.get("email"),
-                    })
+            get_member = member_lookup.get
+            detailed_responses = [
+                {"id": member_id, "answer": answer, **member}
+                for ids_key, answer in _RESPONSE_ID_KEYS
+                for member_id in responses_dict.get(ids_key, ())
+                if (member := get_member(member_id)) is not None
+            ]
 
             # Add the detailed responses array
             result["responses"] = detailed_responses
@@ -32,9 +32,6 @@ class GroupService:
         Returns:
             Tuple of (groups list, total count)
         """
-        # Build base query
-        query = select(Group)
-
         # Apply filters
         conditions = []
 
@@ -50,34 +47,35 @@ class GroupService:
         if filters.has_subgroups is not None:
             if filters.has_subgroups:
                 # Has subgroups (non-empty array)
-                conditions.append(Group.subgroups.isnot(None))
+                conditions.append(Group.subgroup_count > 0)
             else:
                 # No subgroups (null or empty array)
-                conditions.append(
-                    or_(
-                        Group.subgroups.is_(None),
-                        func.json_array_length(Group.subgroups) == 0
-                    )
-                )
+                conditions.append(Group.subgroup_count == 0)
 
-        # Apply all conditions
+        # One query for page and total: count(*) OVER () is computed over
+        # the filtered set before OFFSET/LIMIT, so every row carries it
+        query = select(Group, func.count().over().label("full_count"))
         if conditions:
             query = query.where(*conditions)
 
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await db.execute(count_query)
-        total = total_result.scalar()
-
         # Apply sorting and pagination
         query = query.order_by(Group.name)
         query = query.offset(filters.skip).limit(filters.limit)
 
-        # Execute query
-        result = await db.execute(query)
-        groups = result.scalars().all()
+        rows = (await db.execute(query)).all()
+        if rows:
+            return [row[0] for row in rows], rows[0].full_count
 
-        return list(groups), total or 0
+        if not filters.skip:
+            return [], 0
+
+        # Page past the end: no row to carry the count, ask directly
+        count_query = select(func.count(Group.id))
+        if conditions:
+            count_query = count_query.where(*conditions)
+        total = (await db.execute(count_query)).scalar()
+
+        return [], total or 0
 
     @staticmethod
     async def get_by_id(db: AsyncSession, group_id: int) -> Optional[Group]:
@@ -139,8 +137,8 @@ class GroupService:
         for key, value in update_dict.items():
             setattr(group, key, value)
 
+        # eager_defaults brings updated_at back on the UPDATE itself
         await db.flush()
-        await db.refresh(group)
 
         logger.info(f"Updated group {group_id}")
         return group
@@ -156,25 +154,16 @@ class GroupService:
         Returns:
             Dictionary with statistics
         """
-        # Total groups
-        total_result = await db.execute(select(func.count(Group.id)))
-        total_groups = total_result.scalar() or 0
-
-        # Groups with subgroups
-        with_subgroups_result = await db.execute(
-            select(func.count(Group.id)).where(
-                Group.subgroups.isnot(None)
+        # All three counts in one aggregate scan over the maintained
+        # subgroup_count column
+        result = await db.execute(
+            select(
+                func.count(Group.id),
+                func.count(Group.id).filter(Group.subgroup_count > 0),
+                func.coalesce(func.sum(Group.subgroup_count), 0),
             )
         )
-        groups_with_subgroups = with_subgroups_result.scalar() or 0
-
-        # Count total subgroups
-        # This is approximate since subgroups are stored as JSON
-        total_subgroups = 0
-        groups_result = await db.execute(select(Group.subgroups))
-        for (subgroups,) in groups_result:
-            if subgroups:
-                total_subgroups += len(subgroups)
+        total_groups, groups_with_subgroups, total_subgroups = result.one()
 
         return {
             "total_groups": total_groups,
@@ -2,19 +2,31 @@
 Group synchronization service
 Handles syncing groups from Spond API to local database
 """
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 import logging
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.upsert import dialect_insert, keep_if_unchanged, payload_hash
 from app.models.group import Group
 from app.models.sync_history import SyncHistory
 from app.services.spond_service import SpondService
 
 logger = logging.getLogger(__name__)
 
+# Columns a sync overwrites on an existing group
+_SPOND_OWNED_FIELDS = (
+    "name",
+    "description",
+    "roles",
+    "subgroups",
+    "subgroup_count",
+    "raw_data",
+    "updated_at",
+)
+
 
 class GroupSyncService:
     """
@@ -25,6 +37,7 @@ class GroupSyncService:
     async def sync_groups(
         db: AsyncSession,
         spond_service: SpondService,
+        groups_data: Optional[List[Dict[str, Any]]] = None,
     ) -> Dict[str, int]:
         """
         Sync groups from Spond API to database
@@ -32,6 +45,8 @@ class GroupSyncService:
         Args:
             db: Database session
             spond_service: Spond service instance
+            groups_data: Groups payload already fetched this run (shared
+                with the member sync); fetched from Spond when None
 
         Returns:
             Dictionary with sync statistics
@@ -42,8 +57,7 @@ class GroupSyncService:
             status="running",
             started_at=datetime.utcnow(),
         )
-        db.add(sync_record)
-        await db.flush()
+        # Added with its final values below (one INSERT, no UPDATE)
 
         stats = {
             "fetched": 0,
@@ -54,20 +68,37 @@ class GroupSyncService:
 
         try:
             # Fetch groups from Spond API
-            logger.info("Fetching groups from Spond API")
-            groups_data = await spond_service.get_groups()
+            if groups_data is None:
+                logger.info("Fetching groups from Spond API")
+                groups_data = await spond_service.get_groups()
 
             stats["fetched"] = len(groups_data)
             logger.info(f"Fetched {len(groups_data)} groups from Spond")
 
-            # Process each group
+            # Build one row per group (last occurrence wins on a repeated id;
+            # a single upsert can't touch the same row twice)
+            sync_now = datetime.utcnow()
+            rows_by_id: Dict[str, Dict[str, Any]] = {}
             for group_dict in groups_data:
                 try:
-                    await GroupSyncService._sync_single_group(db, group_dict, stats)
+                    row = GroupSyncService._build_group_row(group_dict, sync_now)
+                    if row is not None:
+                        rows_by_id[row["spond_id"]] = row
                 except Exception as e:
                     logger.error(f"Error syncing group {group_dict.get('id')}: {e}")
                     stats["errors"] += 1
 
+            if rows_by_id:
+                existing_ids = set(
+                    await db.scalars(
+                        select(Group.spond_id).where(Group.spond_id.in_(list(rows_by_id)))
+                    )
+                )
+                await GroupSyncService._upsert_groups(db, list(rows_by_id.values()))
+
+                stats["updated"] = len(existing_ids)
+                stats["created"] = len(rows_by_id) - len(existing_ids)
+
             # Update sync record
             sync_record.status = "completed"
             sync_record.success = True
@@ -75,6 +106,7 @@ class GroupSyncService:
             sync_record.items_fetched = stats["fetched"]
             sync_record.items_created = stats["created"]
             sync_record.items_updated = stats["updated"]
+            db.add(sync_record)
 
             await db.flush()
 
@@ -93,61 +125,68 @@ class GroupSyncService:
             sync_record.success = False
             sync_record.completed_at = datetime.utcnow()
             sync_record.error_message = str(e)
+            db.add(sync_record)
 
             await db.flush()
             raise
 
     @staticmethod
-    async def _sync_single_group(
-        db: AsyncSession,
+    def _build_group_row(
         group_dict: Dict[str, Any],
-        stats: Dict[str, int],
-    ) -> None:
+        sync_now: datetime,
+    ) -> Optional[Dict[str, Any]]:
         """
-        Sync a single group to database
+        Map a Spond group onto ``groups`` column values
 
         Args:
-            db: Database session
             group_dict: Group data from Spond API
-            stats: Statistics dictionary to update
+            sync_now: Timestamp of this sync run (naive UTC)
+
+        Returns:
+            Column values for the upsert, or None if the group has no ID
         """
         spond_id = group_dict.get("id")
         if not spond_id:
             logger.warning("Group missing ID, skipping")
-            return
-
-        # Check if group exists
-        result = await db.execute(
-            select(Group).where(Group.spond_id == spond_id)
-        )
-        existing_group = result.scalar_one_or_none()
+            return None
 
-        # Extract group data
-        now = datetime.utcnow()
-        group_data = {
+        subgroups = group_dict.get("subGroups") or []
+        return {
             "spond_id": spond_id,
             "name": group_dict.get("name", ""),
             "description": group_dict.get("description"),
             "roles": group_dict.get("roles"),
-            "subgroups": group_dict.get("subGroups", []),
+            "subgroups": subgroups,
+            "subgroup_count": len(subgroups),
             "raw_data": group_dict,
-            "last_synced_at": now,
+            "content_hash": payload_hash(group_dict),
+            "last_synced_at": sync_now,
+            "created_at": sync_now,
+            "updated_at": sync_now,
         }
 
-        if existing_group:
-            # Update existing group
-            for key, value in group_data.items():
-                setattr(existing_group, key, value)
-            existing_group.updated_at = now
-            stats["updated"] += 1
-            logger.debug(f"Updated group: {group_data['name']}")
-        else:
-            # Create new group
-            group_data["created_at"] = now
-            group_data["updated_at"] = now
-            new_group = Group(**group_data)
-            db.add(new_group)
-            stats["created"] += 1
-            logger.debug(f"Created group: {group_data['name']}")
-
-        await db.flush()
+    @staticmethod
+    async def _upsert_groups(db: AsyncSession, rows: List[Dict[str, Any]]) -> None:
+        """
+        Insert new groups and refresh existing ones in one statement
+
+        ``INSERT ... ON CONFLICT (spond_id) DO UPDATE``, executed once with
+        all rows as parameters; field_defs and created_at are left alone on
+        existing rows. A group whose Spond payload is unchanged (same
+        content_hash) only gets last_synced_at bumped.
+
+        Args:
+            db: Database session
+            rows: Rows from ``_build_group_row``, unique by spond_id
+        """
+        stmt = dialect_insert(db)(Group.__table__)
+        excluded = stmt.excluded
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Group.spond_id],
+            set_={
+                **keep_if_unchanged(Group, excluded, _SPOND_OWNED_FIELDS),
+                "content_hash": excluded.content_hash,
+                "last_synced_at": excluded.last_synced_at,
+            },
+        )
+        await db.execute(stmt, rows)
@@ -1,10 +1,11 @@
 """
 Member service for CRUD operations
 """
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import logging
+import time
 
-from sqlalchemy import select, func, or_, text
+from sqlalchemy import event, select, func, or_, text, update as sa_update
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -15,10 +16,35 @@ from app.schemas.member import MemberUpdate, MemberFilters
 
 logger = logging.getLogger(__name__)
 
+# In-process TTL cache for get_statistics, keyed by group_id. Per worker;
+# member writes clear it once their transaction has committed.
+STATS_TTL_SEC = 30
+_stats_cache: Dict[Optional[str], Tuple[float, Dict[str, Any]]] = {}
+
 
 class MemberService:
     """Service for member CRUD operations"""
 
+    @staticmethod
+    def invalidate_statistics_cache() -> None:
+        """Drop all cached member statistics"""
+        _stats_cache.clear()
+
+    @staticmethod
+    def invalidate_statistics_cache_on_commit(db: AsyncSession) -> None:
+        """
+        Drop all cached member statistics once db's transaction commits
+
+        Clearing before the commit would let a concurrent reader cache the
+        pre-commit counts again for the whole TTL.
+        """
+        event.listen(
+            db.sync_session,
+            "after_commit",
+            lambda session: MemberService.invalidate_statistics_cache(),
+            once=True,
+        )
+
     @staticmethod
     def _apply_group_filters(
         query,
@@ -58,11 +84,14 @@ class MemberService:
         """
         Get all members with optional filtering and pagination.
         """
-        query = select(Member)
+        # count(*) OVER () carries the filtered total on every row, so page
+        # and total come back in one query
+        query = select(Member, func.count().over().label("full_count"))
 
         conditions = []
 
         if filters.search:
+            # Served by the pg_trgm GIN indexes on all three columns
             search_term = f"%{filters.search}%"
             conditions.append(
                 or_(
@@ -97,17 +126,25 @@ class MemberService:
         if conditions:
             query = query.where(*conditions)
 
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await db.execute(count_query)
-        total = total_result.scalar()
-
         query = MemberService._apply_sort(query, filters.sort_by, filters.sort_order)
         query = query.offset(filters.skip).limit(filters.limit)
 
-        result = await db.execute(query)
-        members = result.scalars().unique().all()
+        rows = (await db.execute(query)).unique().all()
+        if rows:
+            return [row[0] for row in rows], rows[0].full_count
 
-        return list(members), total or 0
+        if not filters.skip:
+            return [], 0
+
+        # Page past the end: no row to carry the count, ask directly
+        count_query = select(func.count()).select_from(
+            query.with_only_columns(Member.id)
+            .order_by(None).limit(None).offset(None)
+            .subquery()
+        )
+        total = (await db.execute(count_query)).scalar()
+
+        return [], total or 0
 
     @staticmethod
     def _apply_sort(query, sort_by: str, sort_order: str):
@@ -187,16 +224,25 @@ class MemberService:
         member_id: int,
         update_data: MemberUpdate,
     ) -> Optional[Member]:
-        member = await MemberService.get_by_id(db, member_id)
-        if not member:
-            return None
-
         update_dict = update_data.model_dump(exclude_unset=True)
-        for key, value in update_dict.items():
-            setattr(member, key, value)
+        if not update_dict:
+            return await MemberService.get_by_id(db, member_id)
+
+        # One UPDATE ... RETURNING instead of SELECT + UPDATE + re-SELECT;
+        # a missing member simply returns no row.
+        result = await db.execute(
+            sa_update(Member)
+            .where(Member.id == member_id)
+            .values(**update_dict)
+            .returning(Member)
+            .execution_options(populate_existing=True)
+        )
+        member = result.scalar_one_or_none()
+        if member is None:
+            return None
 
-        await db.flush()
-        await db.refresh(member)
+        # email/phone edits move the with_email/with_phone counts
+        MemberService.invalidate_statistics_cache_on_commit(db)
 
         logger.info(f"Updated member {member_id}")
         return member
@@ -209,23 +255,27 @@ class MemberService:
         """
         Get member statistics, optionally scoped to a single Spond group.
         """
-
-        def base_query(column_filter=None):
-            q = select(func.count(func.distinct(Member.id)))
-            if column_filter is not None:
-                q = q.where(column_filter)
-            return MemberService._apply_group_filter(q, group_id)
-
-        total_members = (await db.execute(base_query())).scalar() or 0
-        members_with_email = (
-            await db.execute(base_query(Member.email.isnot(None)))
-        ).scalar() or 0
-        members_with_phone = (
-            await db.execute(base_query(Member.phone_number.isnot(None)))
-        ).scalar() or 0
-        members_with_profile = (
-            await db.execute(base_query(Member.profile.isnot(None)))
-        ).scalar() or 0
+        cached = _stats_cache.get(group_id)
+        if cached and time.monotonic() - cached[0] < STATS_TTL_SEC:
+            return cached[1]
+
+        # The four member counts in one scan via FILTER clauses. DISTINCT
+        # because the group filter joins through group_members.
+        distinct_members = func.count(func.distinct(Member.id))
+        counts_query = MemberService._apply_group_filter(
+            select(
+                distinct_members.label("total"),
+                distinct_members.filter(Member.email.isnot(None)).label("with_email"),
+                distinct_members.filter(Member.phone_number.isnot(None)).label("with_phone"),
+                distinct_members.filter(Member.profile.isnot(None)).label("with_profile"),
+            ),
+            group_id,
+        )
+        counts = (await db.execute(counts_query)).one()
+        total_members = counts.total or 0
+        members_with_email = counts.with_email or 0
+        members_with_phone = counts.with_phone or 0
+        members_with_profile = counts.with_profile or 0
 
         # Average groups per member: count associations per member, then average.
         per_member_counts = (
@@ -246,10 +296,17 @@ class MemberService:
         )
         average_groups_per_member = float(avg_result.scalar() or 0.0)
 
-        return {
+        stats = {
             "total_members": total_members,
             "members_with_email": members_with_email,
             "members_with_phone": members_with_phone,
             "members_with_profile": members_with_profile,
             "average_groups_per_member": average_groups_per_member,
         }
+        now = time.monotonic()
+        # Drop expired entries: group_id comes from the client, so keys
+        # that are never asked for again must not pile up
+        for key in [k for k, (at, _) in _stats_cache.items() if now - at >= STATS_TTL_SEC]:
+            del _stats_cache[key]
+        _stats_cache[group_id] = (now, stats)
+        return stats
@@ -2,21 +2,40 @@
 Member synchronization service
 Handles syncing members from Spond API to local database
 """
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Set, Tuple
 from datetime import datetime, timezone
 import logging
 
+from dateutil import parser as dateutil_parser
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.upsert import dialect_insert, keep_if_unchanged, payload_hash
 from app.models.member import Member
 from app.models.group import Group
 from app.models.group_member import GroupMember
 from app.models.sync_history import SyncHistory
+from app.services.member_service import MemberService
 from app.services.spond_service import SpondService
 
 logger = logging.getLogger(__name__)
 
+# Columns a sync overwrites on an existing member
+_MEMBER_SYNCED_FIELDS = (
+    "first_name",
+    "last_name",
+    "email",
+    "phone_number",
+    "profile",
+    "member_created_time",
+    "fields",
+    "raw_data",
+    "updated_at",
+)
+
+# Max spond_ids per IN (...) existence query
+_IN_CHUNK_SIZE = 10_000
+
 
 class MemberSyncService:
     """
@@ -28,6 +47,7 @@ class MemberSyncService:
         db: AsyncSession,
         spond_service: SpondService,
         group_id: Optional[str] = None,
+        groups_data: Optional[List[Dict[str, Any]]] = None,
     ) -> Dict[str, int]:
         """
         Sync members from Spond API to database
@@ -40,6 +60,8 @@ class MemberSyncService:
             db: Database session
             spond_service: Spond service instance
             group_id: Optional specific Spond group ID to sync members from
+            groups_data: Groups payload already fetched this run (shared
+                with the group sync); used instead of fetching all groups
 
         Returns:
             Dictionary with sync statistics
@@ -49,8 +71,7 @@ class MemberSyncService:
             status="running",
             started_at=datetime.utcnow(),
         )
-        db.add(sync_record)
-        await db.flush()
+        # Added with its final values below, as in the events sync
 
         stats = {
             "fetched": 0,
@@ -64,7 +85,7 @@ class MemberSyncService:
                 logger.info(f"Fetching members from group {group_id}")
                 group_data = await spond_service.get_group(group_id)
                 groups_data = [group_data] if group_data else []
-            else:
+            elif groups_data is None:
                 logger.info("Fetching members from all groups")
                 groups_data = await spond_service.get_groups()
 
@@ -73,7 +94,12 @@ class MemberSyncService:
             # Build {spond_id -> groups.id} lookup once to avoid N+1 queries.
             group_lookup = await MemberSyncService._build_group_lookup(db)
 
-            member_ids_seen = set()
+            # Collect one row per member (last occurrence wins, as before)
+            # and one association row per (member, group) pair, then write
+            # both with a bulk upsert each instead of per-member round-trips
+            sync_now = datetime.utcnow()
+            member_rows: Dict[str, Dict[str, Any]] = {}
+            assoc_rows: Dict[Tuple[str, int], Dict[str, Any]] = {}
             for group_dict in groups_data:
                 try:
                     spond_group_id = group_dict.get("id")
@@ -89,17 +115,19 @@ class MemberSyncService:
 
                     for member_dict in members_list:
                         try:
-                            spond_member_id = (
-                                member_dict.get("id")
-                                or member_dict.get("profile", {}).get("id")
-                            )
-                            if spond_member_id and spond_member_id not in member_ids_seen:
-                                member_ids_seen.add(spond_member_id)
-                                stats["fetched"] += 1
-
-                            await MemberSyncService._sync_single_member(
-                                db, member_dict, db_group_id, stats
-                            )
+                            row = MemberSyncService._build_member_row(member_dict, sync_now)
+                            if row is None:
+                                continue
+                            spond_member_id = row["spond_id"]
+                            member_rows[spond_member_id] = row
+                            assoc_rows[(spond_member_id, db_group_id)] = {
+                                "group_id": db_group_id,
+                                "role_uids": member_dict.get("roles", []) or [],
+                                "subgroup_uids": member_dict.get("subGroups", []) or [],
+                                "last_synced_at": sync_now,
+                                "created_at": sync_now,
+                                "updated_at": sync_now,
+                            }
                         except Exception as e:
                             logger.error(f"Error syncing member: {e}")
                             stats["errors"] += 1
@@ -108,12 +136,40 @@ class MemberSyncService:
                     logger.error(f"Error processing group {group_dict.get('id')}: {e}")
                     stats["errors"] += 1
 
+            stats["fetched"] = len(member_rows)
+            if member_rows:
+                # Existence check in IN-list chunks, well under the bind
+                # parameter limits of asyncpg and SQLite
+                spond_ids = list(member_rows)
+                existing_ids: Set[str] = set()
+                for i in range(0, len(spond_ids), _IN_CHUNK_SIZE):
+                    existing_ids.update(
+                        await db.scalars(
+                            select(Member.spond_id).where(
+                                Member.spond_id.in_(spond_ids[i:i + _IN_CHUNK_SIZE])
+                            )
+                        )
+                    )
+                member_db_ids = await MemberSyncService._upsert_members(
+                    db, list(member_rows.values())
+                )
+                for (spond_member_id, _), assoc in assoc_rows.items():
+                    assoc["member_id"] = member_db_ids[spond_member_id]
+                await MemberSyncService._upsert_group_members(db, list(assoc_rows.values()))
+
+                stats["updated"] = len(existing_ids)
+                stats["created"] = len(member_rows) - len(existing_ids)
+
+                # Fresh members invalidate the cached statistics (once committed)
+                MemberService.invalidate_statistics_cache_on_commit(db)
+
             sync_record.status = "completed"
             sync_record.success = True
             sync_record.completed_at = datetime.utcnow()
             sync_record.items_fetched = stats["fetched"]
             sync_record.items_created = stats["created"]
             sync_record.items_updated = stats["updated"]
+            db.add(sync_record)
 
             await db.flush()
 
@@ -131,6 +187,7 @@ class MemberSyncService:
             sync_record.success = False
             sync_record.completed_at = datetime.utcnow()
             sync_record.error_message = str(e)
+            db.add(sync_record)
 
             await db.flush()
             raise
@@ -142,20 +199,19 @@ class MemberSyncService:
         return {spond_id: db_id for spond_id, db_id in result.all()}
 
     @staticmethod
-    async def _sync_single_member(
-        db: AsyncSession,
+    def _build_member_row(
         member_dict: Dict[str, Any],
-        db_group_id: int,
-        stats: Dict[str, int],
-    ) -> None:
+        sync_now: datetime,
+    ) -> Optional[Dict[str, Any]]:
         """
-        Upsert a single member and their association to the given group.
+        Map a Spond group member onto ``members`` column values
 
         Args:
-            db: Database session
             member_dict: Member data from Spond API
-            db_group_id: surrogate `groups.id` for the group the member appears in
-            stats: Statistics dictionary to update (Member-level only)
+            sync_now: Timestamp of this sync run (naive UTC)
+
+        Returns:
+            Column values for the upsert, or None if the member has no ID
         """
         spond_id = member_dict.get("id")
         profile = member_dict.get("profile", {})
@@ -166,32 +222,28 @@ class MemberSyncService:
 
         if not spond_id:
             logger.warning("Member missing ID, skipping")
-            return
-
-        result = await db.execute(
-            select(Member).where(Member.spond_id == spond_id)
-        )
-        existing_member = result.scalar_one_or_none()
+            return None
 
         first_name = profile.get("firstName", member_dict.get("firstName", ""))
         last_name = profile.get("lastName", member_dict.get("lastName", ""))
 
-        role_uids = member_dict.get("roles", []) or []
-        subgroup_uids = member_dict.get("subGroups", []) or []
-
         created_time_str = member_dict.get("createdTime")
         created_time = None
         if created_time_str:
             try:
-                from dateutil import parser
-                created_time = parser.parse(created_time_str)
+                # Spond sends ISO 8601; fromisoformat (C, accepts 'Z' since
+                # 3.11) is far cheaper per member than dateutil's parser,
+                # which stays only as the fallback for anything non-ISO
+                try:
+                    created_time = datetime.fromisoformat(created_time_str)
+                except ValueError:
+                    created_time = dateutil_parser.parse(created_time_str)
                 if created_time.tzinfo is not None:
                     created_time = created_time.astimezone(timezone.utc).replace(tzinfo=None)
             except Exception:
                 logger.warning(f"Failed to parse created time: {created_time_str}")
 
-        now = datetime.utcnow()
-        member_data = {
+        return {
             "spond_id": spond_id,
             "first_name": first_name,
             "last_name": last_name,
@@ -201,52 +253,64 @@ class MemberSyncService:
             "member_created_time": created_time,
             "fields": member_dict.get("fields", {}),
             "raw_data": member_dict,
-            "last_synced_at": now,
+            "content_hash": payload_hash(member_dict),
+            "last_synced_at": sync_now,
+            "created_at": sync_now,
+            "updated_at": sync_now,
         }
 
-        if existing_member:
-            for key, value in member_data.items():
-                setattr(existing_member, key, value)
-            existing_member.updated_at = now
-            # Only count as updated the first time we touch this member this sync.
-            stats["updated"] += 1
-            member_db_id = existing_member.id
-            logger.debug(f"Updated member: {first_name} {last_name}")
-        else:
-            member_data["created_at"] = now
-            member_data["updated_at"] = now
-            new_member = Member(**member_data)
-            db.add(new_member)
-            await db.flush()  # populate new_member.id
-            member_db_id = new_member.id
-            stats["created"] += 1
-            logger.debug(f"Created member: {first_name} {last_name}")
-
-        # Upsert the (member, group) association with per-group role/subgroup data.
-        assoc_result = await db.execute(
-            select(GroupMember).where(
-                GroupMember.member_id == member_db_id,
-                GroupMember.group_id == db_group_id,
-            )
-        )
-        assoc = assoc_result.scalar_one_or_none()
-
-        if assoc:
-            assoc.role_uids = role_uids
-            assoc.subgroup_uids = subgroup_uids
-            assoc.last_synced_at = now
-            assoc.updated_at = now
-        else:
-            db.add(
-                GroupMember(
-                    member_id=member_db_id,
-                    group_id=db_group_id,
-                    role_uids=role_uids,
-                    subgroup_uids=subgroup_uids,
-                    last_synced_at=now,
-                    created_at=now,
-                    updated_at=now,
-                )
-            )
+    @staticmethod
+    async def _upsert_members(
+        db: AsyncSession,
+        rows: List[Dict[str, Any]],
+    ) -> Dict[str, int]:
+        """
+        Insert new members and refresh existing ones in one statement
+
+        A member whose Spond payload is unchanged (same content_hash) only
+        gets last_synced_at bumped.
+
+        Args:
+            db: Database session
+            rows: Rows from ``_build_member_row``, unique by spond_id
+
+        Returns:
+            Mapping of spond_id -> members.id for every row
+        """
+        stmt = dialect_insert(db)(Member.__table__)
+        excluded = stmt.excluded
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Member.spond_id],
+            set_={
+                **keep_if_unchanged(Member, excluded, _MEMBER_SYNCED_FIELDS),
+                "content_hash": excluded.content_hash,
+                "last_synced_at": excluded.last_synced_at,
+            },
+        ).returning(Member.spond_id, Member.id)
+        result = await db.execute(stmt, rows)
+        return {spond_id: member_id for spond_id, member_id in result.all()}
 
-        await db.flush()
+    @staticmethod
+    async def _upsert_group_members(
+        db: AsyncSession,
+        rows: List[Dict[str, Any]],
+    ) -> None:
+        """
+        Insert or refresh (member, group) associations in one statement
+
+        Args:
+            db: Database session
+            rows: Association rows, unique by (member_id, group_id)
+        """
+        stmt = dialect_insert(db)(GroupMember.__table__)
+        excluded = stmt.excluded
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[GroupMember.member_id, GroupMember.group_id],
+            set_={
+                "role_uids": excluded.role_uids,
+                "subgroup_uids": excluded.subgroup_uids,
+                "last_synced_at": excluded.last_synced_at,
+                "updated_at": excluded.updated_at,
+            },
+        )
+        await db.execute(stmt, rows)
@@ -1,9 +1,12 @@
 """
 Background scheduler service for automated synchronization
 """
+import asyncio
 import logging
+import math
+import time
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
@@ -18,6 +21,12 @@ from app.services.member_sync_service import MemberSyncService
 
 logger = logging.getLogger(__name__)
 
+# Manually triggered job that runs the events, groups and members syncs together
+SYNC_ALL_JOB_ID = "sync_all"
+
+# Recurring job that runs whichever of the enabled Spond syncs are due
+SYNC_SPOND_JOB_ID = "sync_spond"
+
 
 class SchedulerService:
     """
@@ -27,6 +36,14 @@ class SchedulerService:
     def __init__(self):
         self.scheduler = AsyncIOScheduler()
         self._is_running = False
+        # Enabled Spond syncs ("events", "groups", "members"): interval in
+        # seconds and the time.monotonic() at which each is next due
+        self._sync_intervals: Dict[str, float] = {}
+        self._sync_due: Dict[str, float] = {}
+        # Serializes Spond sync runs, scheduled and manual alike (the
+        # /events, /groups and /members sync routes take it too): two runs
+        # at once would upsert the same rows and aggregates concurrently
+        self.sync_lock = asyncio.Lock()
 
     async def start(self):
         """Start the scheduler"""
@@ -74,44 +91,34 @@ class SchedulerService:
         except Exception as e:
             logger.warning(f"Could not configure bueskyting scraper job: {e}")
 
-        # Events sync job
-        if settings.SYNC_EVENTS_ENABLED:
-            interval_minutes = settings.SYNC_EVENTS_INTERVAL_MINUTES
-            self.scheduler.add_job(
-                self._sync_events_job,
-                trigger=IntervalTrigger(minutes=interval_minutes),
-                id="sync_events",
-                name="Sync Events from Spond",
-                replace_existing=True,
-                max_instances=1,
+        # Spond syncs share one coalesced job ticking at the GCD of their
+        # intervals; each tick runs the syncs that are due, concurrently
+        intervals = {
+            task: minutes
+            for task, enabled, minutes in (
+                ("events", settings.SYNC_EVENTS_ENABLED, settings.SYNC_EVENTS_INTERVAL_MINUTES),
+                ("groups", settings.SYNC_GROUPS_ENABLED, settings.SYNC_GROUPS_INTERVAL_MINUTES),
+                ("members", settings.SYNC_MEMBERS_ENABLED, settings.SYNC_MEMBERS_INTERVAL_MINUTES),
             )
-            logger.info(f"Scheduled events sync every {interval_minutes} minutes")
-
-        # Groups sync job
-        if settings.SYNC_GROUPS_ENABLED:
-            interval_minutes = settings.SYNC_GROUPS_INTERVAL_MINUTES
+            if enabled
+        }
+        if intervals:
+            now = time.monotonic()
+            self._sync_intervals = {task: minutes * 60 for task, minutes in intervals.items()}
+            # First run one interval after startup, as with separate interval jobs
+            self._sync_due = {task: now + secs for task, secs in self._sync_intervals.items()}
             self.scheduler.add_job(
-                self._sync_groups_job,
-                trigger=IntervalTrigger(minutes=interval_minutes),
-                id="sync_groups",
-                name="Sync Groups from Spond",
+                self._sync_spond_job,
+                trigger=IntervalTrigger(minutes=math.gcd(*intervals.values())),
+                id=SYNC_SPOND_JOB_ID,
+                name="Sync from Spond",
                 replace_existing=True,
                 max_instances=1,
+                coalesce=True,
+                misfire_grace_time=60,
             )
-            logger.info(f"Scheduled groups sync every {interval_minutes} minutes")
-
-        # Members sync job
-        if settings.SYNC_MEMBERS_ENABLED:
-            interval_minutes = settings.SYNC_MEMBERS_INTERVAL_MINUTES
-            self.scheduler.add_job(
-                self._sync_members_job,
-                trigger=IntervalTrigger(minutes=interval_minutes),
-                id="sync_members",
-                name="Sync Members from Spond",
-                replace_existing=True,
-                max_instances=1,
-            )
-            logger.info(f"Scheduled members sync every {interval_minutes} minutes")
+            for task, minutes in intervals.items():
+                logger.info(f"Scheduled {task} sync every {minutes} minutes")
 
     async def _sync_events_job(self):
         """Background job to sync events"""
@@ -133,13 +140,15 @@ class SchedulerService:
         except Exception as e:
             logger.error(f"Scheduled events sync failed: {e}", exc_info=True)
 
-    async def _sync_groups_job(self):
+    async def _sync_groups_job(self, groups_data: Optional[List[Dict[str, Any]]] = None):
         """Background job to sync groups"""
         logger.info("Starting scheduled groups sync")
         try:
             async with AsyncSessionLocal() as db:
                 spond_service = await get_spond_service()
-                stats = await GroupSyncService.sync_groups(db, spond_service)
+                stats = await GroupSyncService.sync_groups(
+                    db, spond_service, groups_data=groups_data
+                )
                 await db.commit()
                 logger.info(
                     f"Scheduled groups sync completed: "
@@ -149,13 +158,15 @@ class SchedulerService:
         except Exception as e:
             logger.error(f"Scheduled groups sync failed: {e}", exc_info=True)
 
-    async def _sync_members_job(self):
+    async def _sync_members_job(self, groups_data: Optional[List[Dict[str, Any]]] = None):
         """Background job to sync members"""
         logger.info("Starting scheduled members sync")
         try:
             async with AsyncSessionLocal() as db:
                 spond_service = await get_spond_service()
-                stats = await MemberSyncService.sync_members(db, spond_service)
+                stats = await MemberSyncService.sync_members(
+                    db, spond_service, groups_data=groups_data
+                )
                 await db.commit()
                 logger.info(
                     f"Scheduled members sync completed: "
@@ -165,6 +176,60 @@ class SchedulerService:
         except Exception as e:
             logger.error(f"Scheduled members sync failed: {e}", exc_info=True)
 
+    async def _run_syncs(self, events: bool, groups: bool, members: bool):
+        """Run the selected Spond syncs, overlapping independent parts
+
+        Events and groups/members touch different tables and each job opens
+        its own session, so they run concurrently. Members stay after groups:
+        member sync resolves memberships against the synced groups.
+
+        Runs one at a time: a run started while another is in progress
+        waits for it to finish.
+        """
+        async def _groups_then_members():
+            groups_data = None
+            if groups and members:
+                # One groups download per run, shared by the groups and
+                # members syncs; on failure each sync fetches (and records
+                # its own error) as usual
+                try:
+                    groups_data = await (await get_spond_service()).get_groups()
+                except Exception as e:
+                    logger.error(f"Fetching groups for sync failed: {e}")
+            if groups:
+                await self._sync_groups_job(groups_data)
+            if members:
+                await self._sync_members_job(groups_data)
+
+        async with self.sync_lock:
+            # The jobs log and swallow their own errors
+            jobs = []
+            if events:
+                jobs.append(self._sync_events_job())
+            if groups or members:
+                jobs.append(_groups_then_members())
+            await asyncio.gather(*jobs)
+
+    async def _sync_spond_job(self):
+        """Background job running the Spond syncs due at this tick"""
+        now = time.monotonic()
+        due = set()
+        for task, interval in self._sync_intervals.items():
+            if self._sync_due[task] <= now:
+                due.add(task)
+                # Skip ahead past missed runs rather than replaying them
+                missed = (now - self._sync_due[task]) // interval + 1
+                self._sync_due[task] += missed * interval
+        if not due:
+            return
+
+        logger.info(f"Starting scheduled Spond sync: {', '.join(sorted(due))}")
+        await self._run_syncs(
+            events="events" in due,
+            groups="groups" in due,
+            members="members" in due,
+        )
+
     async def _scrape_bueskyting_job(self):
         """Background job to scrape bueskyting.no"""
         logger.info("Starting scheduled bueskyting scrape")
@@ -197,10 +262,47 @@ class SchedulerService:
 
     def trigger_job(self, job_id: str):
         """Manually trigger a job"""
+        # On-demand only: one-off runs, not recurring jobs. All of them go
+        # through _run_syncs, so they queue behind a running sync instead
+        # of overlapping it.
+        one_off_jobs = {
+            SYNC_ALL_JOB_ID: ({"events": True, "groups": True, "members": True}, "Sync everything from Spond"),
+        }
+        # The single-sync ids of the former recurring jobs, which (as then)
+        # exist only while that sync is enabled
+        for task, name in (
+            ("events", "Sync Events from Spond"),
+            ("groups", "Sync Groups from Spond"),
+            ("members", "Sync Members from Spond"),
+        ):
+            if task in self._sync_intervals:
+                one_off_jobs[f"sync_{task}"] = (
+                    {"events": False, "groups": False, "members": False, task: True},
+                    name,
+                )
+
+        if job_id in one_off_jobs:
+            syncs, name = one_off_jobs[job_id]
+            self.scheduler.add_job(
+                self._run_syncs,
+                kwargs=syncs,
+                id=job_id,
+                name=name,
+                replace_existing=True,
+                max_instances=1,
+            )
+            logger.info(f"Manually triggered job: {job_id}")
+            return
+
         job = self.scheduler.get_job(job_id)
         if not job:
             raise ValueError(f"Job {job_id} not found")
 
+        if job_id == SYNC_SPOND_JOB_ID:
+            # Run every enabled sync on this tick, not just the ones due
+            now = time.monotonic()
+            self._sync_due = dict.fromkeys(self._sync_due, now)
+
         job.modify(next_run_time=datetime.now())
         logger.info(f"Manually triggered job: {job_id}")
 
@@ -2,10 +2,14 @@
 Spond API service wrapper
 Handles all communication with the Spond API using the spond and spond-classes libraries
 """
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
 from datetime import datetime
+import asyncio
+import json
 import logging
 
+import aiohttp
+from pydantic import TypeAdapter, ValidationError
 from spond.spond import Spond
 from spond_classes import Event as SpondEvent, Group as SpondGroup
 
@@ -13,6 +17,25 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Base payload for create_event, serialized once; json.loads() of it is a
+# cheaper fresh copy than copy.deepcopy() of the nested template dict
+_EVENT_TEMPLATE_JSON = json.dumps(Spond._EVENT_TEMPLATE)
+
+# create_event fields copied as-is into the template (same names there).
+# `inviteTime` is Spond's "send later" field — when set, the event sits in
+# scheduled state on Spond until that timestamp. When omitted, Spond sends
+# invitations immediately.
+_DIRECT_EVENT_FIELDS = frozenset({
+    "heading", "description", "spondType",
+    "startTimestamp", "endTimestamp", "maxAccepted",
+    "commentsDisabled", "autoAccept", "visibility",
+    "inviteTime",
+})
+
+# spond-classes models are pydantic models; validate whole lists in one call
+_EVENT_LIST_ADAPTER = TypeAdapter(List[SpondEvent])
+_GROUP_LIST_ADAPTER = TypeAdapter(List[SpondGroup])
+
 
 # ============================================================
 # Upstream-compat shim: Spond.login endpoint moved
@@ -58,6 +81,10 @@ class SpondService:
         self._client: Optional[Spond] = None
         self._username = settings.SPOND_USERNAME
         self._password = settings.SPOND_PASSWORD
+        # Serializes logins so concurrent callers share one
+        self._login_lock = asyncio.Lock()
+        # In-flight read fetches, keyed by (kind, id), see _coalesced
+        self._inflight: Dict[Tuple[str, ...], asyncio.Future] = {}
 
     async def _get_client(self) -> Spond:
         """
@@ -73,10 +100,34 @@ class SpondService:
                     "Please set SPOND_USERNAME and SPOND_PASSWORD in .env"
                 )
 
-            self._client = Spond(
+            client = Spond(
                 username=self._username,
                 password=self._password
             )
+            # The library's session uses aiohttp's default connector, which
+            # drops idle connections after 15 s and re-resolves DNS every 10 s.
+            # Keep connections (and their TLS sessions) around long enough to
+            # be reused across bursts of API requests. The client is only
+            # published once its tuned session is in place, so no caller
+            # gets one whose session is about to be closed.
+            default_session = client.clientsession
+            client.clientsession = aiohttp.ClientSession(
+                cookie_jar=aiohttp.CookieJar(),
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=20,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75,
+                ),
+            )
+            await default_session.close()
+
+            if self._client is not None:
+                # Another caller published a client while we awaited the close
+                await client.clientsession.close()
+                return self._client
+
+            self._client = client
             logger.info("Spond client initialized")
 
         return self._client
@@ -94,6 +145,39 @@ class SpondService:
         msg = str(error)
         return "401" in msg and ("tokenExpired" in msg or "Not authenticated" in msg)
 
+    async def _login(self, client: Spond, stale_token: Optional[str] = None) -> None:
+        """Log the client in, unless a concurrent caller already has.
+
+        Cold starts and token expiry hit every in-flight call at once (e.g.
+        batch_change_event_responses, or a sync's parallel fetches); without
+        the lock each of them would run its own login round-trip.
+
+        Args:
+            client: The Spond client
+            stale_token: Token the caller saw rejected; any other non-empty
+                token means someone already logged in again
+        """
+        async with self._login_lock:
+            if client.token and client.token != stale_token:
+                return
+            client.token = None
+            await client.login()
+
+    async def _coalesced(self, key: Tuple[str, ...], fetch):
+        """Run fetch(), or join an identical fetch that is already in flight.
+
+        Concurrent page loads and syncs often ask for the same event, group
+        or groups list at once; they share one Spond request instead of each
+        sending their own. The shield keeps one caller's cancellation from
+        cancelling the fetch the others are waiting on.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
     async def _call_with_reauth(self, make_call):
         """Run a Spond library call, re-authenticating once on 401 tokenExpired.
 
@@ -103,7 +187,10 @@ class SpondService:
         read paths (event/group/member sync) survive token expiry too.
         """
         client = await self._get_client()
+        if not client.token:
+            await self._login(client)
         for attempt in range(2):
+            used_token = client.token
             try:
                 return await make_call(client)
             except Exception as e:
@@ -112,8 +199,7 @@ class SpondService:
                         "Spond returned 401 (token expired); "
                         "re-authenticating and retrying"
                     )
-                    client.token = None
-                    await client.login()
+                    await self._login(client, stale_token=used_token)
                     continue
                 raise
 
@@ -165,7 +251,7 @@ class SpondService:
                 )
             )
 
-            logger.info(f"Fetched {len(events_data)} events from Spond API")
+            logger.debug("Fetched %d events from Spond API", len(events_data))
             return events_data
 
         except Exception as e:
@@ -183,10 +269,13 @@ class SpondService:
             Event dictionary or None if not found
         """
         try:
-            event_data = await self._call_with_reauth(
-                lambda client: client.get_event(event_id)
+            event_data = await self._coalesced(
+                ("event", event_id),
+                lambda: self._call_with_reauth(
+                    lambda client: client.get_event(event_id)
+                ),
             )
-            logger.info(f"Fetched event {event_id}")
+            logger.debug("Fetched event %s", event_id)
             return event_data
 
         except Exception as e:
@@ -230,27 +319,18 @@ class SpondService:
             # but since we're making a direct API call, we need to ensure authentication
             if not client.token:
                 logger.info("Authenticating Spond client before event creation...")
-                await client.login()
+                await self._login(client)
                 logger.info("Spond client authenticated successfully")
 
             # Use the event template as base
-            from spond.spond import Spond
-            import copy
-            event_payload = copy.deepcopy(Spond._EVENT_TEMPLATE)
-
-            # Direct field updates (these field names match the template).
-            # `inviteTime` is Spond's "send later" field — when set, the
-            # event sits in scheduled state on Spond until that timestamp.
-            # When omitted, Spond sends invitations immediately.
-            direct_fields = [
-                "heading", "description", "spondType",
-                "startTimestamp", "endTimestamp", "maxAccepted",
-                "commentsDisabled", "autoAccept", "visibility",
-                "inviteTime",
-            ]
-            for field in direct_fields:
-                if field in event_data and event_data[field] is not None:
-                    event_payload[field] = event_data[field]
+            event_payload = json.loads(_EVENT_TEMPLATE_JSON)
+
+            # Direct field updates (these field names match the template)
+            event_payload.update({
+                field: value
+                for field, value in event_data.items()
+                if field in _DIRECT_EVENT_FIELDS and value is not None
+            })
 
             # Handle location separately (it's a nested object)
             if event_data.get("location"):
@@ -269,7 +349,7 @@ class SpondService:
                 if invited_member_ids is not None:
                     # Use the specific members that were selected
                     member_ids = invited_member_ids
-                    logger.info(f"Using {len(member_ids)} selected members for invitation")
+                    logger.debug("Using %d selected members for invitation", len(member_ids))
                 else:
                     # Fetch all group members (default behavior). Guard the
                     # Spond library call: its _get_entity() iterates
@@ -292,10 +372,12 @@ class SpondService:
                     if isinstance(group_data, dict) and isinstance(
                         group_data.get("members"), list
                     ):
-                        for member in group_data["members"]:
-                            if isinstance(member, dict) and "id" in member:
-                                member_ids.append(member["id"])
-                    logger.info(f"Found {len(member_ids)} members in group {group_id} (inviting all)")
+                        member_ids = [
+                            member["id"]
+                            for member in group_data["members"]
+                            if isinstance(member, dict) and "id" in member
+                        ]
+                    logger.debug("Found %d members in group %s (inviting all)", len(member_ids), group_id)
 
                 event_payload["recipients"] = {
                     "group": {"id": group_id},
@@ -305,7 +387,7 @@ class SpondService:
             # Set owners (responsible persons) if provided
             if owner_ids:
                 event_payload["owners"] = [{"id": owner_id} for owner_id in owner_ids]
-                logger.info(f"Setting {len(owner_ids)} responsible persons for event")
+                logger.debug("Setting %d responsible persons for event", len(owner_ids))
             else:
                 # Remove owners if None - it's not required for event creation
                 if "owners" in event_payload and event_payload["owners"] == [{"id": None}]:
@@ -343,29 +425,29 @@ class SpondService:
             # client is a long-lived singleton that only logs in when token
             # is unset — so a stale token yields a 401 tokenExpired. Re-login
             # once and retry with a fresh Bearer header before giving up.
-            import json
             url = f"{client.api_url}sponds"
             for attempt in range(2):
+                used_token = client.token
                 async with client.clientsession.post(
                     url, json=event_payload, headers=client.auth_headers
                 ) as r:
-                    response_text = await r.text()
-
                     if r.status == 401 and attempt == 0:
                         logger.info(
                             "Spond returned 401 (token expired); "
                             "re-authenticating and retrying event creation"
                         )
-                        client.token = None
-                        await client.login()
+                        await self._login(client, stale_token=used_token)
                         continue
 
                     if r.status >= 400:
+                        response_text = await r.text()
                         logger.error(f"Spond API error {r.status}: {response_text}")
                         raise Exception(f"Spond API error {r.status}: {response_text}")
 
-                    result = json.loads(response_text)
-                    logger.info(f"Created event in Spond: {result.get('id')}")
+                    # json.loads takes the raw bytes (UTF-8/16/32 detected
+                    # from the payload), skipping a separate text decode
+                    result = json.loads(await r.read())
+                    logger.info("Created event in Spond: %s", result.get("id"))
                     return result
 
         except Exception as e:
@@ -391,7 +473,7 @@ class SpondService:
 
         try:
             result = await client.update_event(event_id, updates)
-            logger.info(f"Updated event {event_id}")
+            logger.info("Updated event %s", event_id)
             return result
 
         except Exception as e:
@@ -422,13 +504,55 @@ class SpondService:
             payload = {"response": response_type}
 
             result = await client.change_response(event_id, user_id, payload)
-            logger.info(f"Changed response for user {user_id} on event {event_id}")
+            logger.info("Changed response for user %s on event %s", user_id, event_id)
             return result
 
         except Exception as e:
             logger.error(f"Error changing response: {e}")
             raise
 
+    async def batch_change_event_responses(
+        self,
+        event_id: str,
+        user_ids: List[str],
+        response_type: str,
+        concurrency: int = 8
+    ) -> List[str]:
+        """
+        Change several users' responses to an event
+
+        Spond has no bulk response endpoint, so this issues one call per
+        user, up to `concurrency` at a time over the shared client session.
+
+        Args:
+            event_id: Spond event ID
+            user_ids: User IDs
+            response_type: Response type (accepted, declined, etc.)
+            concurrency: Maximum number of calls in flight
+
+        Returns:
+            User IDs whose response could not be changed
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _change(user_id: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.change_event_response(event_id, user_id, response_type)
+
+        results = await asyncio.gather(
+            *(_change(user_id) for user_id in user_ids), return_exceptions=True
+        )
+        failed = [
+            user_id
+            for user_id, result in zip(user_ids, results)
+            if isinstance(result, Exception)
+        ]
+        logger.info(
+            "Changed %d/%d responses on event %s",
+            len(user_ids) - len(failed), len(user_ids), event_id,
+        )
+        return failed
+
     async def get_event_attendance_xlsx(self, event_id: str) -> bytes:
         """
         Get event attendance as Excel file
@@ -443,47 +567,128 @@ class SpondService:
 
         try:
             xlsx_data = await client.get_event_attendance_xlsx(event_id)
-            logger.info(f"Generated attendance XLSX for event {event_id}")
+            logger.debug("Generated attendance XLSX for event %s", event_id)
             return xlsx_data
 
         except Exception as e:
             logger.error(f"Error generating attendance XLSX: {e}")
             raise
 
-    async def update_event_attendees(
+    async def stream_event_attendance_xlsx(
         self,
         event_id: str,
-        member_ids: List[str],
-        group_id: str
+        chunk_size: int = 65536
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream event attendance Excel file in chunks
+
+        Same export as get_event_attendance_xlsx, but yields the body as it
+        arrives instead of buffering the whole file, so large rosters are
+        never held in memory at once.
+
+        Args:
+            event_id: Spond event ID
+            chunk_size: Maximum size of each yielded chunk in bytes
+
+        Yields:
+            Excel file byte chunks
+        """
+        client = await self._get_client()
+
+        # Direct API call, so authenticate ourselves (see create_event)
+        if not client.token:
+            await self._login(client)
+
+        url = f"{client.api_url}sponds/{event_id}/export"
+        for attempt in range(2):
+            used_token = client.token
+            async with client.clientsession.get(
+                url, headers=client.auth_headers
+            ) as r:
+                if r.status == 401 and attempt == 0:
+                    logger.info(
+                        "Spond returned 401 (token expired); "
+                        "re-authenticating and retrying attendance export"
+                    )
+                    await self._login(client, stale_token=used_token)
+                    continue
+
+                if r.status >= 400:
+                    response_text = await r.text()
+                    logger.error(f"Spond API error {r.status}: {response_text}")
+                    raise Exception(f"Spond API error {r.status}: {response_text}")
+
+                async for chunk in r.content.iter_chunked(chunk_size):
+                    yield chunk
+
+                logger.debug("Streamed attendance XLSX for event %s", event_id)
+                return
+
+    async def update_event_fields(
+        self,
+        event_id: str,
+        member_ids: Optional[List[str]] = None,
+        group_id: Optional[str] = None,
+        owner_ids: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """
-        Update which members are invited to an event
+        Update invited members and/or responsible persons in one request
+
+        The library's update_event posts the whole event, rebuilt from its
+        cached copy plus the given updates, so changing attendees and owners
+        with separate calls makes each post carry the other's stale value.
+        Sending both in one update avoids that and saves a round trip.
 
         Args:
             event_id: Spond event ID
-            member_ids: List of member IDs to invite
+            member_ids: Member IDs to invite (requires group_id)
             group_id: Group ID the event belongs to
+            owner_ids: Profile IDs for responsible persons
 
         Returns:
             Updated event dictionary
         """
         client = await self._get_client()
 
-        try:
-            updates = {
-                "recipients": {
-                    "group": {"id": group_id},
-                    "groupMembers": member_ids
-                }
+        updates: Dict[str, Any] = {}
+        if member_ids is not None and group_id is not None:
+            updates["recipients"] = {
+                "group": {"id": group_id},
+                "groupMembers": member_ids
             }
+        if owner_ids is not None:
+            updates["owners"] = [{"id": owner_id} for owner_id in owner_ids]
+
+        try:
             result = await client.update_event(event_id, updates)
-            logger.info(f"Updated attendees for event {event_id}: {len(member_ids)} members")
+            logger.info("Updated %s for event %s", ", ".join(updates), event_id)
             return result
 
         except Exception as e:
-            logger.error(f"Error updating event attendees: {e}")
+            logger.error(f"Error updating event {event_id}: {e}")
             raise
 
+    async def update_event_attendees(
+        self,
+        event_id: str,
+        member_ids: List[str],
+        group_id: str
+    ) -> Dict[str, Any]:
+        """
+        Update which members are invited to an event
+
+        Args:
+            event_id: Spond event ID
+            member_ids: List of member IDs to invite
+            group_id: Group ID the event belongs to
+
+        Returns:
+            Updated event dictionary
+        """
+        return await self.update_event_fields(
+            event_id, member_ids=member_ids, group_id=group_id
+        )
+
     async def update_event_owners(
         self,
         event_id: str,
@@ -499,19 +704,7 @@ class SpondService:
         Returns:
             Updated event dictionary
         """
-        client = await self._get_client()
-
-        try:
-            updates = {
-                "owners": [{"id": owner_id} for owner_id in owner_ids]
-            }
-            result = await client.update_event(event_id, updates)
-            logger.info(f"Updated owners for event {event_id}: {len(owner_ids)} persons")
-            return result
-
-        except Exception as e:
-            logger.error(f"Error updating event owners: {e}")
-            raise
+        return await self.update_event_fields(event_id, owner_ids=owner_ids)
 
     # ============================================================
     # Groups API
@@ -525,10 +718,11 @@ class SpondService:
             List of group dictionaries
         """
         try:
-            groups_data = await self._call_with_reauth(
-                lambda client: client.get_groups()
+            groups_data = await self._coalesced(
+                ("groups",),
+                lambda: self._call_with_reauth(lambda client: client.get_groups()),
             )
-            logger.info(f"Fetched {len(groups_data)} groups from Spond API")
+            logger.debug("Fetched %d groups from Spond API", len(groups_data))
             return groups_data
 
         except Exception as e:
@@ -546,10 +740,13 @@ class SpondService:
             Group dictionary or None if not found
         """
         try:
-            group_data = await self._call_with_reauth(
-                lambda client: client.get_group(group_id)
+            group_data = await self._coalesced(
+                ("group", group_id),
+                lambda: self._call_with_reauth(
+                    lambda client: client.get_group(group_id)
+                ),
             )
-            logger.info(f"Fetched group {group_id}")
+            logger.debug("Fetched group %s", group_id)
             return group_data
 
         except Exception as e:
@@ -574,7 +771,7 @@ class SpondService:
             person_data = await self._call_with_reauth(
                 lambda client: client.get_person(user_identifier)
             )
-            logger.info(f"Fetched person: {user_identifier}")
+            logger.debug("Fetched person: %s", user_identifier)
             return person_data
 
         except Exception as e:
@@ -599,7 +796,7 @@ class SpondService:
             messages_data = await self._call_with_reauth(
                 lambda client: client.get_messages(max_chats=max_chats)
             )
-            logger.info(f"Fetched messages")
+            logger.debug("Fetched messages")
             return messages_data
 
         except Exception as e:
@@ -634,7 +831,7 @@ class SpondService:
                 group_uid=group_uid,
                 chat_id=chat_id
             )
-            logger.info(f"Sent message")
+            logger.info("Sent message")
             return result
 
         except Exception as e:
@@ -660,6 +857,11 @@ class SpondService:
         """
         events_data = await self.get_events(**kwargs)
 
+        try:
+            return _EVENT_LIST_ADAPTER.validate_python(events_data)
+        except ValidationError:
+            pass  # Parse one by one below to skip just the bad events
+
         typed_events = []
         for event_dict in events_data:
             try:
@@ -679,6 +881,11 @@ class SpondService:
         """
         groups_data = await self.get_groups()
 
+        try:
+            return _GROUP_LIST_ADAPTER.validate_python(groups_data)
+        except ValidationError:
+            pass  # Parse one by one below to skip just the bad groups
+
         typed_groups = []
         for group_dict in groups_data:
             try:
@@ -708,3 +915,15 @@ async def get_spond_service() -> SpondService:
         _spond_service = SpondService()
 
     return _spond_service
+
+
+async def close_spond_service() -> None:
+    """
+    Close the global SpondService's HTTP session (application shutdown)
+
+    Every Spond call in the process goes through this one client and its
+    keep-alive connection pool; close it once instead of leaving the
+    aiohttp session to be garbage-collected unclosed.
+    """
+    if _spond_service is not None:
+        await _spond_service.close()
@@ -7,100 +7,141 @@ the analytics-compatible response format by adding a "responses"
 array constructed from the UID arrays.
 """
 import asyncio
-from sqlalchemy import select
-from sqlalchemy.orm import attributes
+import json
+from sqlalchemy import bindparam, func, select, text
 from app.db.session import AsyncSessionLocal
 from app.models.event import Event
 
-
-async def migrate():
-    """Migrate all existing events to new response format"""
-
-    async with AsyncSessionLocal() as db:
-        print("Starting response format migration...")
-        print("=" * 60)
-
-        # Fetch all events with responses
+# Events loaded, migrated and committed per round (Python path)
+PAGE_SIZE = 1000
+
+# (answer, old-format UID list key), in the order the array is built
+ANSWER_KEYS = (
+    ("accepted", "accepted_uids"),
+    ("declined", "declined_uids"),
+    ("unanswered", "unanswered_uids"),
+    ("waitinglistavailable", "waiting_list_uids"),
+    ("unconfirmed", "unconfirmed_uids"),
+)
+
+# PostgreSQL: build every event's "responses" array server-side in one
+# statement. Same result as the Python path: answers in ANSWER_KEYS order,
+# uids in list order; events that already have the key, or have no/empty
+# responses, are left alone.
+MIGRATE_SQL = text("""
+UPDATE events e
+SET responses = (
+    e.responses::jsonb || jsonb_build_object('responses', COALESCE((
+        SELECT jsonb_agg(
+            jsonb_build_object('answer', a.answer, 'profile', jsonb_build_object('id', u.uid))
+            ORDER BY a.ord, u.n
+        )
+        FROM (VALUES
+            (1, 'accepted', 'accepted_uids'),
+            (2, 'declined', 'declined_uids'),
+            (3, 'unanswered', 'unanswered_uids'),
+            (4, 'waitinglistavailable', 'waiting_list_uids'),
+            (5, 'unconfirmed', 'unconfirmed_uids')
+        ) AS a(ord, answer, key)
+        CROSS JOIN LATERAL jsonb_array_elements(
+            CASE WHEN jsonb_typeof(e.responses::jsonb -> a.key) = 'array'
+                 THEN e.responses::jsonb -> a.key ELSE '[]'::jsonb END
+        ) WITH ORDINALITY AS u(uid, n)
+    ), '[]'::jsonb))
+)::json
+WHERE jsonb_typeof(e.responses::jsonb) = 'object'
+  AND e.responses::jsonb <> '{}'::jsonb
+  AND NOT (e.responses::jsonb ? 'responses')
+""")
+
+
+# Python path write: set just the new key server-side (SQLite json_set),
+# so each row sends only its built array instead of the whole blob
+_events = Event.__table__
+PATCH_RESPONSES = (
+    _events.update()
+    .where(_events.c.id == bindparam("b_id"))
+    .values(responses=func.json_set(
+        _events.c.responses, "$.responses", func.json(bindparam("b_arr"))
+    ))
+)
+
+
+async def _migrate_in_sql(db) -> int:
+    """Single server-side UPDATE (PostgreSQL)"""
+    result = await db.execute(MIGRATE_SQL)
+    await db.commit()
+    return result.rowcount
+
+
+async def _migrate_in_python(db) -> int:
+    """Page-by-page rewrite for databases without jsonb (SQLite dev)"""
+    # Walk the table in primary-key order, one page at a time, so only
+    # PAGE_SIZE rows of (id, responses) are held in memory at once.
+    # Already-migrated events are filtered out by the query itself (json_type
+    # is NULL only for a missing key), so re-runs don't fetch them at all.
+    migrated = 0
+    last_id = 0
+
+    while True:
         result = await db.execute(
-            select(Event).where(Event.responses.isnot(None))
+            select(Event.id, Event.responses)
+            .where(
+                Event.id > last_id,
+                Event.responses.isnot(None),
+                func.json_type(Event.responses, "$.responses").is_(None),
+            )
+            .order_by(Event.id)
+            .limit(PAGE_SIZE)
         )
-        events = result.scalars().all()
-
-        print(f"Found {len(events)} events with responses to migrate")
-        print()
-
-        migrated = 0
-        skipped = 0
-
-        for event in events:
-            # Skip if already in new format
-            if event.responses and "responses" in event.responses:
-                skipped += 1
-                continue
+        page = result.all()
+        if not page:
+            break
+        last_id = page[-1].id
 
+        updates = []
+        for event_id, responses in page:
             # Check if in old format
-            if not event.responses:
-                skipped += 1
+            if not responses:
                 continue
 
-            old_format = event.responses
-
             # Build responses array from UID arrays
-            responses_array = []
-
-            # Add accepted responses
-            for uid in old_format.get("accepted_uids", []):
-                responses_array.append({
-                    "answer": "accepted",
-                    "profile": {"id": uid}
-                })
-
-            # Add declined responses
-            for uid in old_format.get("declined_uids", []):
-                responses_array.append({
-                    "answer": "declined",
-                    "profile": {"id": uid}
-                })
-
-            # Add unanswered responses
-            for uid in old_format.get("unanswered_uids", []):
-                responses_array.append({
-                    "answer": "unanswered",
-                    "profile": {"id": uid}
-                })
-
-            # Add waiting list responses
-            for uid in old_format.get("waiting_list_uids", []):
-                responses_array.append({
-                    "answer": "waitinglistavailable",
-                    "profile": {"id": uid}
-                })
-
-            # Add unconfirmed responses
-            for uid in old_format.get("unconfirmed_uids", []):
-                responses_array.append({
-                    "answer": "unconfirmed",
-                    "profile": {"id": uid}
-                })
-
-            # Update event with new format while keeping old format
-            # Must create new dict to trigger SQLAlchemy dirty flag
-            new_responses = dict(event.responses)
-            new_responses["responses"] = responses_array
-            event.responses = new_responses
-
-            # Mark the attribute as modified
-            attributes.flag_modified(event, "responses")
+            responses_array = [
+                {"answer": answer, "profile": {"id": uid}}
+                for answer, key in ANSWER_KEYS
+                for uid in responses.get(key, [])
+            ]
 
-            migrated += 1
+            # Add the new format while keeping the old one
+            updates.append({"b_id": event_id, "b_arr": json.dumps(responses_array)})
 
-            # Commit in batches
-            if migrated % 100 == 0:
-                print(f"Migrated {migrated} events...")
-                await db.commit()
+            migrated += 1
 
-        # Final commit
+        # One executemany UPDATE ... WHERE id = ? per page, committed per
+        # page so an interrupted run resumes by skipping the migrated rows
+        if updates:
+            await db.execute(PATCH_RESPONSES, updates)
         await db.commit()
+        print(f"Migrated {migrated} events...")
+
+    return migrated
+
+
+async def migrate():
+    """Migrate all existing events to new response format"""
+
+    async with AsyncSessionLocal() as db:
+        print("Starting response format migration...")
+        print("=" * 60)
+
+        total = await db.scalar(
+            select(func.count()).select_from(Event).where(Event.responses.isnot(None))
+        )
+        if db.bind.dialect.name == "postgresql":
+            migrated = await _migrate_in_sql(db)
+        else:
+            migrated = await _migrate_in_python(db)
+        skipped = total - migrated
 
         print()
         print("=" * 60)
@@ -108,7 +149,7 @@ async def migrate():
         print("=" * 60)
         print(f"  Migrated:  {migrated:>5} events")
         print(f"  Skipped:   {skipped:>5} events (already in new format)")
-        print(f"  Total:     {len(events):>5} events")
+        print(f"  Total:     {total:>5} events")
         print("=" * 60)
 
         if migrated > 0:
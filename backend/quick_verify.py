@@ -6,6 +6,7 @@ Can run without virtual environment
 
 import sys
 import os
+from functools import lru_cache
 from pathlib import Path
 
 # Colors
@@ -21,15 +22,26 @@ def print_status(message, status):
     symbol = f"{GREEN}✓{NC}" if status else f"{RED}✗{NC}"
     print(f"{symbol} {message}")
 
+@lru_cache(maxsize=None)
+def list_directory(path):
+    """Map entry name -> is-directory for one directory, read once"""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name: entry.is_dir() for entry in entries}
+    except OSError:
+        return {}
+
 def check_file(path, description):
     """Check if file exists"""
-    exists = Path(path).exists()
+    parent, name = os.path.split(path)
+    exists = name in list_directory(parent or ".")
     print_status(f"{description}: {path}", exists)
     return exists
 
 def check_directory(path, description):
     """Check if directory exists"""
-    exists = Path(path).is_dir()
+    parent, name = os.path.split(path)
+    exists = list_directory(parent or ".").get(name, False)
     print_status(f"{description}: {path}", exists)
     return exists
 
@@ -104,11 +116,10 @@ def main():
         all_pass = all_pass and result
     print()
 
-    # Try importing key modules (without running)
+    # Compile key modules without importing them: no config/.env loading
+    # and no third-party imports, so this also works outside the venv
     print(f"{BLUE}Code Syntax Check:{NC}")
 
-    sys.path.insert(0, str(Path.cwd()))
-
     modules_to_check = [
         ("app.core.config", "Configuration module"),
         ("app.core.clerk", "Clerk JWT verifier"),
@@ -119,17 +130,16 @@ def main():
     ]
 
     for module_name, desc in modules_to_check:
+        source_path = Path(*module_name.split(".")).with_suffix(".py")
         try:
-            __import__(module_name)
+            compile(source_path.read_bytes(), str(source_path), "exec")
             print_status(f"{desc} syntax", True)
-        except ImportError as e:
-            print_status(f"{desc} syntax (missing deps: {e})", False)
+        except OSError:
+            print_status(f"{desc} syntax (not found: {source_path})", False)
+            all_pass = False
         except SyntaxError as e:
             print_status(f"{desc} syntax: {e}", False)
             all_pass = False
-        except Exception as e:
-            # Other errors are ok (e.g., missing .env), we just check syntax
-            print_status(f"{desc} syntax", True)
     print()
 
     # Summary
@@ -107,12 +107,19 @@ async def ensure_local_admin(email: str, role: str, full_name: Optional[str]) ->
         return row
 
 
-async def _clerk_request(method: str, path: str, *, json=None, params=None) -> dict:
-    url = f"{CLERK_API_BASE.rstrip('/')}/{path.lstrip('/')}"
-    headers = {"Authorization": f"Bearer {CLERK_SECRET_KEY}",
-               "Content-Type": "application/json"}
-    async with httpx.AsyncClient(timeout=30) as client:
-        resp = await client.request(method, url, headers=headers, json=json, params=params)
+def _clerk_client() -> httpx.AsyncClient:
+    """One client (and connection pool) for all Clerk calls of a run."""
+    return httpx.AsyncClient(
+        base_url=CLERK_API_BASE.rstrip("/") + "/",
+        headers={"Authorization": f"Bearer {CLERK_SECRET_KEY}",
+                 "Content-Type": "application/json"},
+        timeout=30,
+    )
+
+
+async def _clerk_request(client: httpx.AsyncClient, method: str, path: str,
+                         *, json=None, params=None) -> dict:
+    resp = await client.request(method, path.lstrip("/"), json=json, params=params)
     if resp.status_code >= 400:
         body = resp.text
         try:
@@ -130,7 +137,14 @@ async def ensure_clerk_user(email: str, full_name: Optional[str]) -> Optional[st
                     "On first sign-in the user must already exist in Clerk.")
         return None
 
-    existing = await _clerk_request("GET", "users", params={"email_address": email})
+    async with _clerk_client() as client:
+        return await _ensure_clerk_user(client, email, full_name)
+
+
+async def _ensure_clerk_user(client: httpx.AsyncClient, email: str,
+                             full_name: Optional[str]) -> Optional[str]:
+    existing = await _clerk_request(client, "GET", "users",
+                                    params={"email_address": email})
     if isinstance(existing, list) and existing:
         user_id = existing[0].get("id")
         log.info("Clerk user already exists (id=%s)", user_id)
@@ -147,7 +161,7 @@ async def ensure_clerk_user(email: str, full_name: Optional[str]) -> Optional[st
     if last:
         payload["last_name"] = last
 
-    created = await _clerk_request("POST", "users", json=payload)
+    created = await _clerk_request(client, "POST", "users", json=payload)
     user_id = created.get("id")
     log.info("Clerk user created (id=%s). Email is verified; user can sign in "
              "with any enabled method (Google / magic link / password reset).",
@@ -1,15 +1,35 @@
 """
 Quick diagnostic script to test Spond API connection
+
+Credentials come from SPOND_USERNAME / SPOND_PASSWORD (same as the app's
+.env) or --username / --password. --max-events sets the events page size,
+and each request is timed, so the script doubles as a quick benchmark.
 """
+import argparse
 import asyncio
+import os
+import time
+
 from spond.spond import Spond
 
 
-async def main():
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Spond API diagnostic")
+    parser.add_argument("--username", default=os.environ.get("SPOND_USERNAME"))
+    parser.add_argument("--password", default=os.environ.get("SPOND_PASSWORD"))
+    parser.add_argument("--max-events", type=int, default=100,
+                        help="max_events passed to get_events (default: 100)")
+    args = parser.parse_args()
+    if not args.username or not args.password:
+        parser.error("set SPOND_USERNAME/SPOND_PASSWORD or pass --username/--password")
+    return args
+
+
+async def main(args: argparse.Namespace):
     # Initialize Spond client
     client = Spond(
-        username="lillehammer@bueklubb.no",
-        password="bz*2gVTJqD9Y5W"
+        username=args.username,
+        password=args.password
     )
 
     try:
@@ -17,10 +37,21 @@ async def main():
         print("SPOND API DIAGNOSTIC TEST")
         print("=" * 60)
 
+        # Log in first: on a fresh client both concurrent requests below
+        # would otherwise each log in, and that login would land in the timing
+        await client.login()
+
+        # Tests 1 and 2 are independent requests; send them together
+        started = time.perf_counter()
+        groups, events = await asyncio.gather(
+            client.get_groups(),
+            client.get_events(max_events=args.max_events),
+        )
+        elapsed = time.perf_counter() - started
+
         # Test 1: Fetch groups
         print("\n1. Fetching groups...")
-        groups = await client.get_groups()
-        print(f"   Found {len(groups)} groups:")
+        print(f"   Found {len(groups)} groups ({elapsed:.2f}s together with test 2):")
         for i, group in enumerate(groups[:5], 1):  # Show first 5
             print(f"   {i}. {group.get('name', 'N/A')} (ID: {group.get('id', 'N/A')})")
         if len(groups) > 5:
@@ -28,8 +59,7 @@ async def main():
 
         # Test 2: Fetch events (default parameters)
         print("\n2. Fetching events (default parameters)...")
-        events = await client.get_events(max_events=100)
-        print(f"   Found {len(events)} events:")
+        print(f"   Found {len(events)} events (max_events={args.max_events}):")
         for i, event in enumerate(events[:5], 1):  # Show first 5
             print(f"   {i}. {event.get('heading', 'N/A')} - {event.get('startTimestamp', 'N/A')}")
         if len(events) > 5:
@@ -39,13 +69,16 @@ async def main():
         if groups:
             print("\n3. Checking events in first group (with all filters)...")
             first_group_id = groups[0].get('id')
+            started = time.perf_counter()
             group_events = await client.get_events(
                 group_id=first_group_id,
                 include_hidden=True,
                 include_scheduled=True,
-                max_events=100
+                max_events=args.max_events
             )
-            print(f"   Found {len(group_events)} events in group '{groups[0].get('name')}':")
+            elapsed = time.perf_counter() - started
+            print(f"   Found {len(group_events)} events in group '{groups[0].get('name')}' "
+                  f"({elapsed:.2f}s):")
             for i, event in enumerate(group_events[:10], 1):  # Show first 10
                 heading = event.get('heading', 'N/A')
                 start = event.get('startTimestamp', 'N/A')
@@ -77,4 +110,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(main(parse_args()))